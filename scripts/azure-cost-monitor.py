@@ -22,6 +22,7 @@ Prerequisites:
 
 Installation:
     pip install azure-mgmt-costmanagement azure-identity azure-mgmt-resource requests
+    pip install orjson  # optional, faster JSON export
 
 Usage:
     python3 scripts/azure-cost-monitor.py --project-name "my-project"
@@ -30,12 +31,19 @@ Usage:
 """
 
 import argparse
+import asyncio
+import hashlib
+import heapq
 import json
 import os
+import random
 import subprocess
 import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # Import shared utilities if available
 try:
@@ -46,6 +54,7 @@ try:
         print_status,
         print_success,
         print_warning,
+        read_azure_profile,
     )
 
     AZURE_UTILS_AVAILABLE = True
@@ -65,13 +74,13 @@ except ImportError:
     def print_error(msg):
         print(f"[ERROR] {msg}")
 
+    def read_azure_profile():
+        # Callers then ask the Azure CLI instead
+        return None
 
-try:
-    import requests
-    from azure.identity import DefaultAzureCredential
-    from azure.mgmt.costmanagement import CostManagementClient
-    from azure.mgmt.resource import ResourceManagementClient
-except ImportError as e:
+
+def exit_missing_packages(e: ImportError) -> None:
+    """Explain how to install the Azure packages and exit."""
     print_error(f"Required Azure packages not installed: {e}")
     print_status(
         "Install with: pip install azure-mgmt-costmanagement azure-identity azure-mgmt-resource requests"
@@ -86,38 +95,423 @@ except ImportError as e:
     sys.exit(1)
 
 
+try:
+    from azure.core.exceptions import HttpResponseError
+    from azure.core.rest import HttpRequest
+except ImportError as e:
+    exit_missing_packages(e)
+
+
+def load_azure_sdk() -> None:
+    """Import the Azure SDK clients on first use.
+
+    These imports take several hundred milliseconds, which --help and
+    cached --quiet runs never need to pay.
+    """
+    global requests, RequestsTransport, DefaultAzureCredential
+    global CostManagementClient, ResourceManagementClient, SubscriptionClient
+
+    try:
+        import requests
+        from azure.core.pipeline.transport import RequestsTransport
+        from azure.identity import DefaultAzureCredential
+        from azure.mgmt.costmanagement import CostManagementClient
+        from azure.mgmt.resource import ResourceManagementClient, SubscriptionClient
+    except ImportError as e:
+        exit_missing_packages(e)
+
+
+# Optional C-accelerated JSON codec for large CLI payloads and exports
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+
+# Retry policy for throttled (429) and transient Azure failures
+MAX_RETRY_ATTEMPTS = 5
+MAX_RETRY_DELAY = 30.0
+RETRYABLE_CLI_ERRORS = ("TooManyRequests", "429", "throttl", "ServiceUnavailable")
+
+# SDK calls are retried only by azure-core's RetryPolicy, which already
+# honours Retry-After; these bound it to the same attempts as CLI calls
+SDK_RETRY_OPTIONS = {
+    "retry_total": MAX_RETRY_ATTEMPTS - 1,
+    "retry_backoff_max": MAX_RETRY_DELAY,
+}
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given 1-based attempt."""
+    return random.uniform(0, min(MAX_RETRY_DELAY, 2.0**attempt))
+
+
+def _is_retryable_cli_error(stderr: str) -> bool:
+    """Check whether Azure CLI error output describes a transient failure."""
+    return any(marker in stderr for marker in RETRYABLE_CLI_ERRORS)
+
+
+def call_with_retry(fn, *args, **kwargs):
+    """Call fn, retrying throttled or transient Azure CLI failures.
+
+    Waits follow exponential backoff with jitter. SDK calls are not wrapped:
+    their clients retry through SDK_RETRY_OPTIONS.
+    """
+    for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
+        try:
+            return fn(*args, **kwargs)
+        except subprocess.CalledProcessError as e:
+            retryable = _is_retryable_cli_error(e.stderr or "")
+            if attempt == MAX_RETRY_ATTEMPTS or not retryable:
+                raise
+        time.sleep(_backoff_delay(attempt))
+
+
+async def run_az_with_retry(cmd: List[str]) -> Tuple[int, bytes]:
+    """Run an Azure CLI command, retrying throttled calls with backoff.
+
+    Returns the last (returncode, stdout) pair. stdout is left as bytes so
+    large JSON payloads are parsed without an intermediate decode.
+    """
+    for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode == 0 or not _is_retryable_cli_error(
+            stderr.decode(errors="replace")
+        ):
+            break
+        if attempt < MAX_RETRY_ATTEMPTS:
+            await asyncio.sleep(_backoff_delay(attempt))
+    return process.returncode, stdout
+
+
+# Cost Management data refreshes every 8-24 hours, so cached results stay
+# useful for a while; closed periods never change once billed.
+CURRENT_PERIOD_CACHE_TTL = 60 * 60
+CLOSED_PERIOD_CACHE_TTL = 7 * 24 * 60 * 60
+SUBSCRIPTION_CACHE_TTL = 12 * 60 * 60
+RESOURCE_GROUP_CACHE_TTL = 15 * 60
+
+# Responses the service returns when a query window is too large to answer
+# in one call (payload cap or 30 second timeout); such windows are halved
+OVERSIZED_QUERY_STATUS_CODES = (408, 413, 504)
+
+# Long windows are split into chunks of this many days, queried in parallel
+# by a small pool to stay under the per-subscription throttling limits
+DEFAULT_QUERY_CHUNK_DAYS = 30
+DEFAULT_QUERY_WORKERS = 4
+
+# HTML dashboard template, filled in with str.format()
+DASHBOARD_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Azure Cost Dashboard - {project_name}</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; }}
+        .header {{ background: #0078d4; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
+        .card {{ background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
+        .cost-total {{ font-size: 2em; font-weight: bold; color: #0078d4; }}
+        .cost-breakdown {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }}
+        .alert {{ padding: 15px; border-radius: 4px; margin: 10px 0; }}
+        .alert-critical {{ background-color: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; }}
+        .alert-warning {{ background-color: #fff3cd; border: 1px solid #ffeaa7; color: #856404; }}
+        .alert-ok {{ background-color: #d4edda; border: 1px solid #c3e6cb; color: #155724; }}
+        .refresh-info {{ text-align: center; color: #666; margin-top: 20px; }}
+        table {{ width: 100%; border-collapse: collapse; }}
+        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
+        th {{ background-color: #f8f9fa; }}
+        .cost-cell {{ text-align: right; font-weight: bold; }}
+    </style>
+    <script>
+        function refreshPage() {{
+            location.reload();
+        }}
+        // Auto-refresh every 5 minutes
+        setTimeout(refreshPage, 300000);
+    </script>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Azure Cost Dashboard</h1>
+            <p>Project: {project_name} | Last Updated: {timestamp}</p>
+        </div>
+
+        <div class="card">
+            <h2>Current Month Cost</h2>
+            <div class="cost-total">${total_cost:.2f} USD</div>
+            <p>Period: {period}</p>
+        </div>
+
+        {budget_alerts}
+
+        <div class="card">
+            <h2>Cost Breakdown by Resource Group</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Resource Group</th>
+                        <th>Cost (USD)</th>
+                        <th>Percentage</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {breakdown_rows}
+                </tbody>
+            </table>
+        </div>
+
+        <div class="refresh-info">
+            <p>Dashboard auto-refreshes every 5 minutes</p>
+            <button onclick="refreshPage()">Refresh Now</button>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def chunked_date_ranges(
+    start: datetime, end: datetime, chunk_days: int
+) -> Iterator[Tuple[datetime, datetime]]:
+    """Yield consecutive inclusive (from, to) ranges spanning chunk_days days.
+
+    A range spans chunk_days the way --days does: its end is chunk_days after
+    its start, so the default --days window is a single range.
+
+    >>> end = datetime(2024, 3, 31)
+    >>> start = end - timedelta(days=30)  # the default --days window
+    >>> len(list(chunked_date_ranges(start, end, DEFAULT_QUERY_CHUNK_DAYS)))
+    1
+    """
+    if chunk_days < 1:
+        raise ValueError(f"chunk_days must be positive, got {chunk_days}")
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days), end)
+        yield chunk_start, chunk_end
+        chunk_start = chunk_end + timedelta(days=1)
+
+
+class CostCache:
+    """On-disk JSON cache for cost query results with per-entry expiry."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: Optional[int] = None,
+        refresh: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to ~/.cache/azure-cost-monitor)
+            ttl: Lifetime in seconds overriding the per-entry default
+            refresh: Ignore existing entries but still store new ones
+        """
+        self.cache_dir = cache_dir or os.path.expanduser("~/.cache/azure-cost-monitor")
+        self.ttl = ttl
+        self.refresh = refresh
+
+    @staticmethod
+    def make_key(**params) -> str:
+        """Build a stable cache key from query parameters."""
+        return hashlib.sha256(
+            json.dumps(params, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        if self.refresh:
+            return None
+
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "r") as f:
+                entry = json.load(f)
+        except (IOError, ValueError):
+            return None
+
+        if entry.get("expires_at", 0) < time.time():
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data: Any, ttl: int) -> None:
+        """Store a value under key for ttl seconds."""
+        if self.ttl is not None:
+            ttl = self.ttl
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "w") as f:
+                json.dump({"expires_at": time.time() + ttl, "data": data}, f)
+        except IOError as e:
+            print(f"Warning: Could not write cost cache: {e}")
+
+
+def get_default_subscription_id(credential) -> Optional[str]:
+    """Resolve the subscription to monitor through the SDK.
+
+    Uses AZURE_SUBSCRIPTION_ID when set, otherwise the only subscription
+    visible to the credential. Returns None when that is ambiguous so the
+    caller can fall back to the Azure CLI's selected subscription.
+    """
+    subscription_id = os.environ.get("AZURE_SUBSCRIPTION_ID")
+    if subscription_id:
+        return subscription_id
+
+    load_azure_sdk()
+    try:
+        subscriptions = list(
+            SubscriptionClient(credential, **SDK_RETRY_OPTIONS).subscriptions.list()
+        )
+    except Exception:
+        return None
+
+    if len(subscriptions) == 1:
+        return subscriptions[0].subscription_id
+    return None
+
+
+def get_cli_subscription_id() -> str:
+    """Get the subscription currently selected in the Azure CLI."""
+    try:
+        result = call_with_retry(
+            subprocess.run,
+            ["az", "account", "show", "--query", "id", "-o", "tsv"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except subprocess.CalledProcessError:
+        print(
+            "Error: Could not get Azure subscription ID. Please run 'az login' first."
+        )
+        sys.exit(1)
+
+
 class AzureCostMonitor:
     """Azure Cost Management client for monitoring platform costs."""
 
-    def __init__(self, subscription_id: str, project_name: str = "aks-platform"):
+    def __init__(
+        self,
+        subscription_id: str,
+        project_name: str = "aks-platform",
+        max_workers: Optional[int] = None,
+        cache: Optional[CostCache] = None,
+        credential=None,
+        chunk_days: int = DEFAULT_QUERY_CHUNK_DAYS,
+        query_workers: int = DEFAULT_QUERY_WORKERS,
+    ):
         """Initialize the cost monitor with Azure credentials."""
         self.subscription_id = subscription_id
         self.project_name = project_name
-        self.credential = DefaultAzureCredential()
+        self.max_workers = max_workers
+        self.cache = cache
+        self.chunk_days = chunk_days
+        self.query_workers = query_workers
+        self._resource_groups: Optional[List[str]] = None
+        self.credential = credential
+        self._cost_client = None
+        self._resource_client = None
+        self._subscription_client = None
+
+    def _init_clients(self) -> None:
+        """Create the Azure SDK clients on first use, so cache hits skip them."""
+        if self._cost_client is not None:
+            return
+
+        load_azure_sdk()
+        if self.credential is None:
+            self.credential = DefaultAzureCredential()
+
+        # One pooled session for every client, so parallel queries reuse
+        # TLS connections to management.azure.com instead of reconnecting
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=max(10, self.query_workers)
+        )
+        session.mount("https://", adapter)
+        transport = RequestsTransport(session=session, session_owner=False)
 
         try:
-            self.cost_client = CostManagementClient(self.credential)
-            self.resource_client = ResourceManagementClient(
-                self.credential, subscription_id
+            self._cost_client = CostManagementClient(
+                self.credential, transport=transport, **SDK_RETRY_OPTIONS
+            )
+            self._resource_client = ResourceManagementClient(
+                self.credential,
+                self.subscription_id,
+                transport=transport,
+                **SDK_RETRY_OPTIONS,
+            )
+            self._subscription_client = SubscriptionClient(
+                self.credential, transport=transport, **SDK_RETRY_OPTIONS
             )
         except Exception as e:
             print(f"Error: Failed to initialize Azure clients: {e}")
             print("Ensure you're logged in with: az login")
             sys.exit(1)
 
+    @property
+    def cost_client(self):
+        """Cost Management client."""
+        self._init_clients()
+        return self._cost_client
+
+    @property
+    def resource_client(self):
+        """Resource Management client for the monitored subscription."""
+        self._init_clients()
+        return self._resource_client
+
+    @property
+    def subscription_client(self):
+        """Subscription client sharing the monitor's credential."""
+        self._init_clients()
+        return self._subscription_client
+
     def get_subscription_info(self) -> Dict:
         """Get current subscription information."""
+        cache_key = CostCache.make_key(subscription_info=self.subscription_id)
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            result = subprocess.run(
-                ["az", "account", "show"], capture_output=True, text=True, check=True
-            )
-            return json.loads(result.stdout)
-        except subprocess.CalledProcessError as e:
+            info = self.subscription_client.subscriptions.get(
+                self.subscription_id
+            ).as_dict()
+        except Exception as e:
             print(f"Error getting subscription info: {e}")
             return {}
 
+        if self.cache:
+            self.cache.set(cache_key, info, SUBSCRIPTION_CACHE_TTL)
+        return info
+
     def get_project_resource_groups(self) -> List[str]:
         """Get all resource groups belonging to this project."""
+        if self._resource_groups is not None:
+            return list(self._resource_groups)
+
+        cache_key = CostCache.make_key(
+            resource_groups=self.subscription_id, project=self.project_name
+        )
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._resource_groups = cached
+                return list(cached)
+
         resource_groups = []
 
         try:
@@ -133,27 +527,50 @@ class AzureCostMonitor:
             for env in ["dev", "staging", "prod"]:
                 resource_groups.append(f"rg-{self.project_name}-{env}")
             resource_groups.append(f"{self.project_name}-terraform-state-rg")
-
-        return resource_groups
-
-    def get_cost_data(self, days: int = 30, environment: Optional[str] = None) -> Dict:
-        """Get cost data for the specified period."""
-        end_date = datetime.now()
+            return resource_groups
+
+        self._resource_groups = resource_groups
+        if self.cache:
+            self.cache.set(cache_key, resource_groups, RESOURCE_GROUP_CACHE_TTL)
+        return list(resource_groups)
+
+    def get_cost_data(
+        self,
+        days: int = 30,
+        environment: Optional[str] = None,
+        anchor: Optional[datetime] = None,
+    ) -> Dict:
+        """Get cost data for the period of days ending at anchor (default: now)."""
+        end_date = anchor or datetime.now()
         start_date = end_date - timedelta(days=days)
 
         # Format dates for Azure API
         start_date_str = start_date.strftime("%Y-%m-%d")
         end_date_str = end_date.strftime("%Y-%m-%d")
 
-        scope = f"/subscriptions/{self.subscription_id}"
+        cache_key = CostCache.make_key(
+            subscription=self.subscription_id,
+            project=self.project_name,
+            days=days,
+            environment=environment,
+            granularity=None,
+            end_date=end_date_str,
+        )
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         # Build query parameters
         query_definition = {
             "type": "ActualCost",
             "timeframe": "Custom",
             "timePeriod": {"from": start_date_str, "to": end_date_str},
+            # No granularity: the service sums the whole period and returns
+            # one row per resource group and service instead of per day. This
+            # is smaller than Monthly granularity for any window length; only
+            # get_cost_trend asks for Daily rows.
             "dataset": {
-                "granularity": "Daily",
                 "aggregation": {"totalCost": {"name": "Cost", "function": "Sum"}},
                 "grouping": [
                     {"type": "Dimension", "name": "ResourceGroupName"},
@@ -162,29 +579,192 @@ class AzureCostMonitor:
             },
         }
 
-        # Add resource group filter if environment specified
+        # Restrict the query to the project's resource groups
+        resource_groups = self.get_project_resource_groups()
         if environment:
-            rg_name = f"rg-{self.project_name}-{environment}"
-            query_definition["dataset"]["filter"] = {
-                "dimensions": {
-                    "name": "ResourceGroupName",
-                    "operator": "In",
-                    "values": [rg_name],
-                }
+            resource_groups = [rg for rg in resource_groups if environment in rg]
+
+        if not resource_groups:
+            return {
+                "total_cost": 0.0,
+                "breakdown": {},
+                "period": f"{start_date_str} to {end_date_str}",
+                "currency": "USD",
             }
 
+        query_definition["dataset"]["filter"] = self._resource_group_filter(
+            resource_groups
+        )
+
+        # Periods that ended before this month are fully billed
+        closed = end_date.date() < datetime.now().date().replace(day=1)
+        ttl = CLOSED_PERIOD_CACHE_TTL if closed else CURRENT_PERIOD_CACHE_TTL
         try:
-            # Use Azure CLI as fallback since Cost Management API can be complex
-            return self._get_cost_data_via_cli(days, environment)
+            columns, rows = self._query_rows_chunked(query_definition)
+            cost_data = self._summarize_query_result(
+                columns, rows, f"{start_date_str} to {end_date_str}"
+            )
         except Exception as e:
-            print(f"Error getting cost data: {e}")
-            return {}
+            print(f"Warning: Cost Management query failed, using Azure CLI: {e}")
+            try:
+                cost_data = self._get_cost_data_via_cli(days, environment, end_date)
+            except Exception as e:
+                print(f"Error getting cost data: {e}")
+                return {}
+            # The CLI totals skip resource groups whose call failed, so they
+            # may be partial; keep them only as long as current-period data
+            ttl = CURRENT_PERIOD_CACHE_TTL
+
+        if self.cache:
+            self.cache.set(cache_key, cost_data, ttl)
+        return cost_data
+
+    @staticmethod
+    def _resource_group_filter(resource_groups: List[str]) -> Dict:
+        """Build a query filter matching the given resource groups."""
+        return {
+            "dimensions": {
+                "name": "ResourceGroupName",
+                "operator": "In",
+                "values": resource_groups,
+            }
+        }
+
+    def _query_rows_chunked(self, query_definition: Dict) -> Tuple[List, List[List]]:
+        """Run a cost query, splitting long time periods into parallel chunks.
+
+        Windows spanning up to chunk_days (counted like --days) are a single
+        call. Longer ones are split into chunk_days pieces queried by query_workers threads; the rows of every
+        chunk are concatenated, which is correct both for per-day rows and for
+        per-period totals that are summed afterwards.
+
+        Returns:
+            Tuple of (columns, rows)
+        """
+        time_period = query_definition["timePeriod"]
+        ranges = list(
+            chunked_date_ranges(
+                datetime.strptime(time_period["from"], "%Y-%m-%d"),
+                datetime.strptime(time_period["to"], "%Y-%m-%d"),
+                self.chunk_days,
+            )
+        )
+        if len(ranges) <= 1:
+            return self._query_rows(query_definition)
+
+        chunk_queries = [
+            dict(
+                query_definition,
+                timePeriod={
+                    "from": chunk_start.strftime("%Y-%m-%d"),
+                    "to": chunk_end.strftime("%Y-%m-%d"),
+                },
+            )
+            for chunk_start, chunk_end in ranges
+        ]
+
+        columns, rows = [], []
+        with ThreadPoolExecutor(max_workers=self.query_workers) as executor:
+            for columns, chunk_rows in executor.map(self._query_rows, chunk_queries):
+                rows.extend(chunk_rows)
+        return columns, rows
+
+    def _query_rows(self, query_definition: Dict) -> Tuple[List, List[List]]:
+        """Run a cost query over its whole time period in as few calls as possible.
+
+        The window is requested in a single call. Only if the service rejects
+        it as too large is it split in half, recursively, and the rows of
+        both halves concatenated.
+
+        Returns:
+            Tuple of (columns, rows)
+        """
+        try:
+            result = self.cost_client.query.usage(
+                scope=f"/subscriptions/{self.subscription_id}",
+                parameters=query_definition,
+            )
+            return result.columns, list(self._paginate(result, query_definition))
+        except HttpResponseError as e:
+            time_period = query_definition["timePeriod"]
+            start = datetime.strptime(time_period["from"], "%Y-%m-%d")
+            end = datetime.strptime(time_period["to"], "%Y-%m-%d")
+            if e.status_code not in OVERSIZED_QUERY_STATUS_CODES or start >= end:
+                raise
+
+        middle = start + timedelta(days=(end - start).days // 2)
+        columns, rows = [], []
+        for half_start, half_end in (
+            (start, middle),
+            (middle + timedelta(days=1), end),
+        ):
+            half_query = dict(
+                query_definition,
+                timePeriod={
+                    "from": half_start.strftime("%Y-%m-%d"),
+                    "to": half_end.strftime("%Y-%m-%d"),
+                },
+            )
+            columns, half_rows = self._query_rows(half_query)
+            rows.extend(half_rows)
+        return columns, rows
+
+    def _paginate(self, result, query_definition: Dict) -> Iterator[List]:
+        """Yield rows from a query result, following nextLink pages.
+
+        The SDK does not follow nextLink for query results, so each further
+        page is fetched by re-posting the query to the link, which already
+        carries the skiptoken.
+        """
+        yield from result.rows
+        next_link = result.next_link
+
+        while next_link:
+            request = HttpRequest("POST", next_link, json=query_definition)
+            response = self._send_checked(request)
+            properties = response.json().get("properties", {})
+            yield from properties.get("rows", [])
+            next_link = properties.get("nextLink")
+
+    def _send_checked(self, request):
+        """Send a raw request through the cost client, raising on HTTP errors."""
+        response = self.cost_client._send_request(request)
+        response.raise_for_status()
+        return response
+
+    def _summarize_query_result(self, columns, rows: List[List], period: str) -> Dict:
+        """Build the cost summary from Cost Management query columns and rows."""
+        columns = [column.name for column in columns]
+        cost_index = columns.index("Cost") if "Cost" in columns else 0
+        rg_index = columns.index("ResourceGroupName")
+        currency_index = columns.index("Currency") if "Currency" in columns else None
+
+        # Each row is one resource group and service total (per chunk when the
+        # query was split); they are summed per resource group, and the total
+        # is the sum of the resource groups
+        cost_breakdown = defaultdict(float)
+        for row in rows:
+            cost_breakdown[row[rg_index]] += row[cost_index]
+
+        currency = "USD"
+        if rows and currency_index is not None:
+            currency = rows[0][currency_index]
+
+        return {
+            "total_cost": sum(cost_breakdown.values()),
+            "breakdown": dict(cost_breakdown),
+            "period": period,
+            "currency": currency,
+        }
 
     def _get_cost_data_via_cli(
-        self, days: int, environment: Optional[str] = None
+        self,
+        days: int,
+        environment: Optional[str] = None,
+        anchor: Optional[datetime] = None,
     ) -> Dict:
-        """Get cost data using Azure CLI as fallback."""
-        end_date = datetime.now()
+        """Get cost data using Azure CLI when the Cost Management API fails."""
+        end_date = anchor or datetime.now()
         start_date = end_date - timedelta(days=days)
 
         start_date_str = start_date.strftime("%Y-%m-%d")
@@ -197,45 +777,12 @@ class AzureCostMonitor:
             # Filter to specific environment
             resource_groups = [rg for rg in resource_groups if environment in rg]
 
-        total_cost = 0.0
-        cost_breakdown = {}
-
-        for rg in resource_groups:
-            try:
-                # Check if resource group exists
-                check_cmd = ["az", "group", "show", "--name", rg]
-                result = subprocess.run(check_cmd, capture_output=True, text=True)
-
-                if result.returncode != 0:
-                    continue  # Resource group doesn't exist
-
-                # Get cost for this resource group
-                cost_cmd = [
-                    "az",
-                    "consumption",
-                    "usage",
-                    "list",
-                    "--start-date",
-                    start_date_str,
-                    "--end-date",
-                    end_date_str,
-                    "--query",
-                    f"[?contains(instanceName, '{rg}')].{{cost:pretaxCost,service:meterCategory,date:usageStart}}",
-                    "--output",
-                    "json",
-                ]
-
-                result = subprocess.run(cost_cmd, capture_output=True, text=True)
-
-                if result.returncode == 0 and result.stdout.strip():
-                    usage_data = json.loads(result.stdout)
-                    rg_cost = sum(float(item.get("cost", 0)) for item in usage_data)
-                    total_cost += rg_cost
-                    cost_breakdown[rg] = rg_cost
-
-            except Exception as e:
-                print(f"Warning: Could not get cost for {rg}: {e}")
-                continue
+        cost_breakdown = dict(
+            asyncio.run(
+                self._fetch_rg_costs(resource_groups, start_date_str, end_date_str)
+            )
+        )
+        total_cost = sum(cost_breakdown.values())
 
         return {
             "total_cost": total_cost,
@@ -244,31 +791,135 @@ class AzureCostMonitor:
             "currency": "USD",  # Default, could be enhanced to detect actual currency
         }
 
-    def get_current_month_cost(self) -> Dict:
+    async def _fetch_rg_costs(
+        self, resource_groups: List[str], start_date_str: str, end_date_str: str
+    ) -> List[Tuple[str, float]]:
+        """Get per-resource-group costs with concurrent CLI subprocesses.
+
+        The az calls only wait on Azure REST latency, so they are multiplexed
+        on one event loop, bounded by a semaphore to limit throttling.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers or 16)
+
+        async def fetch(rg: str) -> Optional[Tuple[str, float]]:
+            async with semaphore:
+                return await self._fetch_rg_cost(rg, start_date_str, end_date_str)
+
+        results = await asyncio.gather(
+            *(fetch(rg) for rg in resource_groups), return_exceptions=True
+        )
+
+        rg_costs = []
+        for rg, result in zip(resource_groups, results):
+            if isinstance(result, Exception):
+                print(f"Warning: Could not get cost for {rg}: {result}")
+            elif result is not None:
+                rg_costs.append(result)
+        return rg_costs
+
+    async def _fetch_rg_cost(
+        self, rg: str, start_date_str: str, end_date_str: str
+    ) -> Optional[Tuple[str, float]]:
+        """Get the cost of a single resource group, or None if it has no data.
+
+        Resource groups come from the ARM listing, so there is no separate
+        existence check; a missing group simply has no usage records.
+        """
+        cost_cmd = [
+            "az",
+            "consumption",
+            "usage",
+            "list",
+            "--start-date",
+            start_date_str,
+            "--end-date",
+            end_date_str,
+            "--query",
+            f"[?contains(instanceName, '{rg}')].{{cost:pretaxCost,service:meterCategory,date:usageStart}}",
+            "--output",
+            "json",
+        ]
+
+        returncode, stdout = await run_az_with_retry(cost_cmd)
+
+        if returncode == 0 and stdout.strip():
+            usage_data = json_loads(stdout)
+            return rg, sum(float(item.get("cost", 0)) for item in usage_data)
+
+        return None
+
+    def get_current_month_cost(self, anchor: Optional[datetime] = None) -> Dict:
         """Get cost for the current month."""
-        now = datetime.now()
+        now = anchor or datetime.now()
         start_of_month = now.replace(day=1)
         days_in_month = (now - start_of_month).days + 1
 
-        return self.get_cost_data(days=days_in_month)
+        return self.get_cost_data(days=days_in_month, anchor=now)
+
+    def get_cost_trend(
+        self, days: int = 30, anchor: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Get daily cost trend for analysis, most recent day first."""
+        if days <= 0:
+            return []
+
+        end_date = anchor or datetime.now()
+        dates = [
+            (end_date - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)
+        ]
+        daily_costs = dict.fromkeys(dates, 0.0)
+
+        cache_key = CostCache.make_key(
+            subscription=self.subscription_id,
+            project=self.project_name,
+            days=days,
+            environment=None,
+            granularity="Daily",
+            end_date=dates[0],
+        )
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-    def get_cost_trend(self, days: int = 30) -> List[Dict]:
-        """Get daily cost trend for analysis."""
         resource_groups = self.get_project_resource_groups()
-        trend_data = []
-
-        for i in range(days):
-            date = datetime.now() - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-
-            # This is a simplified version - in practice, you'd query daily costs
-            trend_data.append(
-                {
-                    "date": date_str,
-                    "cost": 0.0,  # Would be populated with actual daily costs
-                }
-            )
+        if not resource_groups:
+            return [{"date": date, "cost": 0.0} for date in dates]
+
+        # One daily-granularity query covers the whole window
+        query_definition = {
+            "type": "ActualCost",
+            "timeframe": "Custom",
+            "timePeriod": {"from": dates[-1], "to": dates[0]},
+            "dataset": {
+                "granularity": "Daily",
+                "aggregation": {"totalCost": {"name": "Cost", "function": "Sum"}},
+                "filter": self._resource_group_filter(resource_groups),
+            },
+        }
 
+        try:
+            columns, rows = self._query_rows_chunked(query_definition)
+            columns = [column.name for column in columns]
+            cost_index = columns.index("Cost") if "Cost" in columns else 0
+            date_index = columns.index("UsageDate")
+
+            for row in rows:
+                # UsageDate is returned as a YYYYMMDD number
+                usage_date = str(int(row[date_index]))
+                date_str = f"{usage_date[:4]}-{usage_date[4:6]}-{usage_date[6:8]}"
+                if date_str in daily_costs:
+                    daily_costs[date_str] += float(row[cost_index])
+        except Exception as e:
+            print(f"Warning: Could not get daily cost trend: {e}")
+            return [{"date": date, "cost": 0.0} for date in dates]
+
+        trend_data = [
+            {"date": date, "cost": cost} for date, cost in daily_costs.items()
+        ]
+
+        if self.cache:
+            self.cache.set(cache_key, trend_data, CURRENT_PERIOD_CACHE_TTL)
         return trend_data
 
     def check_budget_alerts(self, budget_limit: float, current_cost: float) -> Dict:
@@ -297,9 +948,16 @@ class AzureCostMonitor:
 
 
 def format_cost_report(
-    cost_data: Dict, project_name: str, environment: Optional[str] = None
+    cost_data: Dict,
+    project_name: str,
+    environment: Optional[str] = None,
+    top: Optional[int] = 20,
 ) -> str:
-    """Format cost data into a readable report."""
+    """Format cost data into a readable report.
+
+    Only the top most expensive resource groups are listed; pass None to
+    list all of them.
+    """
     report = []
     report.append("=" * 60)
     report.append(f"Azure Cost Report - {project_name}")
@@ -318,14 +976,44 @@ def format_cost_report(
     if breakdown:
         report.append("Cost Breakdown by Resource Group:")
         report.append("-" * 40)
-        for rg, cost in sorted(breakdown.items(), key=lambda x: x[1], reverse=True):
-            percentage = (cost / total_cost * 100) if total_cost > 0 else 0
+        if top is None or top >= len(breakdown):
+            rows = sorted(breakdown.items(), key=lambda x: x[1], reverse=True)
+        else:
+            rows = heapq.nlargest(top, breakdown.items(), key=lambda x: x[1])
+
+        percent_factor = 100.0 / total_cost if total_cost > 0 else 0.0
+        for rg, cost in rows:
+            percentage = cost * percent_factor
             report.append(f"{rg:<30} ${cost:>8.2f} ({percentage:>5.1f}%)")
+        if len(rows) < len(breakdown):
+            report.append(f"... and {len(breakdown) - len(rows)} more")
         report.append("")
 
     return "\n".join(report)
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number above zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for options that must be a whole number, zero or more."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
 def main():
     """Main function to run the cost monitor."""
     parser = argparse.ArgumentParser(
@@ -354,6 +1042,45 @@ def main():
     parser.add_argument(
         "--quiet", action="store_true", help="Minimal output for scripting"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Maximum parallel Azure CLI cost queries (default: 16)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the on-disk result cache"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        metavar="SECONDS",
+        help="Override cache lifetime (default: 1h current, 7d closed periods)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached results and refresh them from Azure",
+    )
+    parser.add_argument(
+        "--top",
+        type=non_negative_int,
+        default=20,
+        help="Resource groups to list in the report, 0 for all (default: 20)",
+    )
+    parser.add_argument(
+        "--chunk-days",
+        type=positive_int,
+        default=DEFAULT_QUERY_CHUNK_DAYS,
+        help=f"Split longer queries into chunks of this many days "
+        f"(default: {DEFAULT_QUERY_CHUNK_DAYS})",
+    )
+    parser.add_argument(
+        "--query-workers",
+        type=positive_int,
+        default=DEFAULT_QUERY_WORKERS,
+        help=f"Maximum parallel Cost Management queries "
+        f"(default: {DEFAULT_QUERY_WORKERS})",
+    )
 
     args = parser.parse_args()
 
@@ -363,20 +1090,23 @@ def main():
         VirtualEnvironmentChecker.check_and_warn_virtual_environment()
         print()
 
-    # Get subscription ID
-    try:
-        result = subprocess.run(
-            ["az", "account", "show", "--query", "id", "-o", "tsv"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        subscription_id = result.stdout.strip()
-    except subprocess.CalledProcessError:
-        print(
-            "Error: Could not get Azure subscription ID. Please run 'az login' first."
+    cache = (
+        None if args.no_cache else CostCache(ttl=args.cache_ttl, refresh=args.refresh)
+    )
+
+    # Get subscription ID. An explicit AZURE_SUBSCRIPTION_ID always wins,
+    # then the subscription selected in the Azure CLI's profile file, so
+    # 'az account set' takes effect without starting the CLI
+    credential = None
+    subscription_id = os.environ.get("AZURE_SUBSCRIPTION_ID")
+    if not subscription_id:
+        subscription_id = (read_azure_profile() or {}).get("id")
+    if not subscription_id:
+        load_azure_sdk()
+        credential = DefaultAzureCredential()
+        subscription_id = (
+            get_default_subscription_id(credential) or get_cli_subscription_id()
         )
-        sys.exit(1)
 
     if not args.quiet:
         print(f"Monitoring costs for project: {args.project_name}")
@@ -386,13 +1116,22 @@ def main():
         print()
 
     # Initialize cost monitor
-    monitor = AzureCostMonitor(subscription_id, args.project_name)
+    monitor = AzureCostMonitor(
+        subscription_id,
+        args.project_name,
+        max_workers=args.concurrency,
+        cache=cache,
+        credential=credential,
+        chunk_days=args.chunk_days,
+        query_workers=args.query_workers,
+    )
 
-    # Get cost data
+    # Get cost data, anchoring every date computation to a single clock read
+    now = datetime.now()
     if args.current_month:
-        cost_data = monitor.get_current_month_cost()
+        cost_data = monitor.get_current_month_cost(anchor=now)
     else:
-        cost_data = monitor.get_cost_data(args.days, args.environment)
+        cost_data = monitor.get_cost_data(args.days, args.environment, anchor=now)
 
     # Check budget alerts
     budget_status = None
@@ -403,7 +1142,9 @@ def main():
 
     # Generate report
     if not args.quiet:
-        report = format_cost_report(cost_data, args.project_name, args.environment)
+        report = format_cost_report(
+            cost_data, args.project_name, args.environment, top=args.top or None
+        )
         print(report)
 
         # Show budget alerts
@@ -425,11 +1166,15 @@ def main():
             "environment": args.environment,
             "cost_data": cost_data,
             "budget_status": budget_status,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
         }
 
-        with open(args.export, "w") as f:
-            json.dump(export_data, f, indent=2)
+        if orjson is not None:
+            with open(args.export, "wb") as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.export, "w") as f:
+                json.dump(export_data, f, indent=2)
 
         if not args.quiet:
             print(f"Cost data exported to: {args.export}")
@@ -441,78 +1186,7 @@ def main():
 
 def create_cost_dashboard():
     """Create a simple HTML dashboard for cost monitoring."""
-    html_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Azure Cost Dashboard - {project_name}</title>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        .header {{ background: #0078d4; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-        .card {{ background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .cost-total {{ font-size: 2em; font-weight: bold; color: #0078d4; }}
-        .cost-breakdown {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }}
-        .alert {{ padding: 15px; border-radius: 4px; margin: 10px 0; }}
-        .alert-critical {{ background-color: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; }}
-        .alert-warning {{ background-color: #fff3cd; border: 1px solid #ffeaa7; color: #856404; }}
-        .alert-ok {{ background-color: #d4edda; border: 1px solid #c3e6cb; color: #155724; }}
-        .refresh-info {{ text-align: center; color: #666; margin-top: 20px; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background-color: #f8f9fa; }}
-        .cost-cell {{ text-align: right; font-weight: bold; }}
-    </style>
-    <script>
-        function refreshPage() {{
-            location.reload();
-        }}
-        // Auto-refresh every 5 minutes
-        setTimeout(refreshPage, 300000);
-    </script>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Azure Cost Dashboard</h1>
-            <p>Project: {project_name} | Last Updated: {timestamp}</p>
-        </div>
-
-        <div class="card">
-            <h2>Current Month Cost</h2>
-            <div class="cost-total">${total_cost:.2f} USD</div>
-            <p>Period: {period}</p>
-        </div>
-
-        {budget_alerts}
-
-        <div class="card">
-            <h2>Cost Breakdown by Resource Group</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Resource Group</th>
-                        <th>Cost (USD)</th>
-                        <th>Percentage</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {breakdown_rows}
-                </tbody>
-            </table>
-        </div>
-
-        <div class="refresh-info">
-            <p>Dashboard auto-refreshes every 5 minutes</p>
-            <button onclick="refreshPage()">Refresh Now</button>
-        </div>
-    </div>
-</body>
-</html>
-"""
-    return html_template
+    return DASHBOARD_TEMPLATE
 
 
 if __name__ == "__main__":
@@ -21,13 +21,33 @@ Usage:
     subscription_id = helper.get_subscription_id()
 """
 
+import functools
+import importlib.util
 import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # Python 3.7
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None
 
 
 class Colors:
@@ -40,24 +60,38 @@ class Colors:
     NC = "\033[0m"  # No Color
 
 
+def _message_prefix(color: str, label: str) -> str:
+    """Build a message prefix, colored only when stdout is a terminal."""
+    if getattr(sys.stdout, "isatty", lambda: False)():
+        return f"{color}[{label}]{Colors.NC} "
+    return f"[{label}] "
+
+
+# Prefixes are built once so redirected output (CI logs, files) has no ANSI codes
+_INFO_PREFIX = _message_prefix(Colors.BLUE, "INFO")
+_SUCCESS_PREFIX = _message_prefix(Colors.GREEN, "SUCCESS")
+_WARNING_PREFIX = _message_prefix(Colors.YELLOW, "WARNING")
+_ERROR_PREFIX = _message_prefix(Colors.RED, "ERROR")
+
+
 def print_status(message: str) -> None:
     """Print informational message with blue color."""
-    print(f"{Colors.BLUE}[INFO]{Colors.NC} {message}")
+    sys.stdout.write(f"{_INFO_PREFIX}{message}\n")
 
 
 def print_success(message: str) -> None:
     """Print success message with green color."""
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.NC} {message}")
+    sys.stdout.write(f"{_SUCCESS_PREFIX}{message}\n")
 
 
 def print_warning(message: str) -> None:
     """Print warning message with yellow color."""
-    print(f"{Colors.YELLOW}[WARNING]{Colors.NC} {message}")
+    sys.stdout.write(f"{_WARNING_PREFIX}{message}\n")
 
 
 def print_error(message: str) -> None:
     """Print error message with red color."""
-    print(f"{Colors.RED}[ERROR]{Colors.NC} {message}")
+    sys.stdout.write(f"{_ERROR_PREFIX}{message}\n")
 
 
 class VirtualEnvironmentChecker:
@@ -104,20 +138,26 @@ class VirtualEnvironmentChecker:
         else:
             project_root = Path(project_root)
 
-        venv_dirs = []
-
-        # Common virtual environment directory names
-        common_names = ["venv", ".venv", "env", ".env", "virtualenv"]
-
-        for name in common_names:
-            venv_path = project_root / name
-            if venv_path.exists() and venv_path.is_dir():
-                # Check if it looks like a virtual environment
-                activate_script = venv_path / "bin" / "activate"
-                activate_script_win = venv_path / "Scripts" / "activate"
+        # One directory listing instead of stat calls per candidate name
+        try:
+            with os.scandir(project_root) as entries:
+                candidates = {
+                    entry.name: entry.path
+                    for entry in entries
+                    if entry.name in VENV_DIR_NAMES and entry.is_dir()
+                }
+        except OSError:
+            return []
 
-                if activate_script.exists() or activate_script_win.exists():
-                    venv_dirs.append(str(venv_path))
+        venv_dirs = []
+        for name in VENV_DIR_NAMES:
+            venv_path = candidates.get(name)
+            # Check if it looks like a virtual environment
+            if venv_path and (
+                os.path.isfile(os.path.join(venv_path, "bin", "activate"))
+                or os.path.isfile(os.path.join(venv_path, "Scripts", "activate"))
+            ):
+                venv_dirs.append(venv_path)
 
         return venv_dirs
 
@@ -197,24 +237,233 @@ class VirtualEnvironmentChecker:
             return False
 
 
+# Leading project name of a requirements.txt line
+REQUIREMENT_NAME_PATTERN = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# Common virtual environment directory names, in search order
+VENV_DIR_NAMES = ("venv", ".venv", "env", ".env", "virtualenv")
+
+# US regions used when the location list cannot be retrieved
+FALLBACK_LOCATIONS = (
+    "eastus",
+    "westus",
+    "westus2",
+    "centralus",
+    "eastus2",
+    "southcentralus",
+)
+
+# Region names change on the order of months, so get_locations serves a list
+# bundled with these scripts (or a newer per-user copy) instead of calling Azure
+LOCATIONS_FILE = Path(__file__).parent / "azure-locations.json"
+LOCATIONS_CACHE_FILE = Path.home() / ".cache" / "azure-platform" / "locations.json"
+LOCATIONS_MAX_AGE = 30 * 24 * 3600  # seconds
+# After a refresh is started, wait this long before trying again, so a refresh
+# that fails (e.g. when not logged in) is not retried on every run
+LOCATIONS_RETRY_DELAY = 24 * 3600  # seconds
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, indent: int = 2) -> str:
+    """
+    Serialize to indented JSON.
+
+    Always uses the json module: orjson formats some values (non-ASCII text,
+    datetimes, floats) differently, and files written here must not change
+    depending on whether it is installed.
+    """
+    return json.dumps(data, indent=indent, default=str)
+
+
+def stream_command_lines(command: List[str]) -> Iterator[str]:
+    """
+    Yield the non-empty stdout lines of a command as it produces them.
+
+    Avoids holding the whole output and a split copy of it in memory.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero
+    """
+    # Read bytes and decode only the lines kept; stdin is closed so the CLI
+    # can never block on an interactive prompt
+    with subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as process:
+        for line in process.stdout:
+            line = line.strip()
+            if line:
+                yield line.decode("utf-8", "replace")
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+def write_text_atomic(path: str, text: str) -> None:
+    """
+    Replace a file's contents without ever leaving it half-written.
+
+    The text goes to a temporary file in the same directory, which is
+    fsynced and renamed over the target.
+
+    Raises:
+        OSError: If the directory or file cannot be written
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_azure_profile() -> Optional[Dict]:
+    """
+    Read the default subscription from the Azure CLI profile file.
+
+    This is the same data `az account show` reports, without starting the
+    CLI. The profile lives in AZURE_CONFIG_DIR (default ~/.azure).
+
+    Returns:
+        The default subscription entry, or None if it cannot be read
+    """
+    config_dir = os.environ.get("AZURE_CONFIG_DIR") or os.path.expanduser("~/.azure")
+    try:
+        # The CLI writes this file with a UTF-8 byte order mark
+        with open(
+            os.path.join(config_dir, "azureProfile.json"), encoding="utf-8-sig"
+        ) as f:
+            profile = json.load(f)
+        return next(sub for sub in profile["subscriptions"] if sub.get("isDefault"))
+    except (OSError, ValueError, KeyError, StopIteration):
+        return None
+
+
+def jmespath_literal(value: str) -> str:
+    """Quote a string as a JMESPath raw string literal."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def refresh_locations_cache() -> List[str]:
+    """
+    List locations with the Azure CLI and store them in the per-user cache.
+
+    Uses `az account list-locations`, which needs no subscription lookup.
+
+    Raises:
+        subprocess.CalledProcessError: If the Azure CLI listing fails
+    """
+    locations = list(
+        stream_command_lines(
+            ["az", "account", "list-locations", "--query", "[].name", "-o", "tsv"]
+        )
+    )
+    if locations:
+        write_text_atomic(str(LOCATIONS_CACHE_FILE), json_dumps(locations))
+    return locations
+
+
 class AzureHelper:
     """Helper class for common Azure operations."""
 
+    _locations_refresh_lock = threading.Lock()
+    _locations_refresh_started = False
+
     def __init__(self, subscription_id: Optional[str] = None):
         """Initialize Azure helper with optional subscription ID."""
-        self.subscription_id = subscription_id or self.get_subscription_id()
+        self._account_cache: Optional[Dict] = None
+        self._auth_ok: Optional[bool] = None
+        self._sdk_clients: Optional[Tuple[Any, Any]] = None
+        self._sdk_checked = False
+        # Resolved from the CLI on first use, so helpers that never need it
+        # (e.g. get_locations via the CLI) skip the az account show call
+        self._subscription_id = subscription_id
+
+    @property
+    def subscription_id(self) -> str:
+        """Subscription ID, looked up from the Azure CLI on first access."""
+        if self._subscription_id is None:
+            self._subscription_id = self.get_subscription_id()
+        return self._subscription_id
+
+    @subscription_id.setter
+    def subscription_id(self, value: str) -> None:
+        self._subscription_id = value
+
+    def _sdk(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Get Azure SDK clients for in-process calls, created on first use.
 
-    def get_subscription_id(self) -> str:
-        """Get current Azure subscription ID."""
-        try:
+        Calling the SDK avoids paying the Azure CLI's multi-second startup on
+        every operation. The SDK packages are optional; when they are not
+        installed this returns None and callers fall back to the CLI.
+
+        Returns:
+            Tuple of (ResourceManagementClient, SubscriptionClient) or None
+        """
+        if not self._sdk_checked:
+            self._sdk_checked = True
+            try:
+                from azure.identity import DefaultAzureCredential
+                from azure.mgmt.resource import (
+                    ResourceManagementClient,
+                    SubscriptionClient,
+                )
+            except ImportError:
+                return None
+
+            credential = DefaultAzureCredential()
+            self._sdk_clients = (
+                ResourceManagementClient(credential, self.subscription_id),
+                SubscriptionClient(credential),
+            )
+        return self._sdk_clients
+
+    def _account(self) -> Dict:
+        """
+        Get the parsed output of `az account show`, running the CLI only once.
+
+        Raises:
+            subprocess.CalledProcessError: If the Azure CLI is not logged in
+            FileNotFoundError: If the Azure CLI is not installed
+            json.JSONDecodeError: If the CLI output is not valid JSON
+        """
+        if self._account_cache is None:
+            # JSON is parsed straight from bytes, no text decode needed
             result = subprocess.run(
-                ["az", "account", "show", "--query", "id", "-o", "tsv"],
+                ["az", "account", "show"],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
-                text=True,
                 check=True,
             )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
+            self._account_cache = json_loads(result.stdout)
+        return self._account_cache
+
+    def refresh(self) -> None:
+        """Discard cached account details so the next call queries the CLI."""
+        self._account_cache = None
+        self._auth_ok = None
+
+    def get_subscription_id(self) -> str:
+        """Get current Azure subscription ID."""
+        try:
+            return self._account()["id"]
+        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
             print_error(f"Failed to get subscription ID: {e}")
             print_status("Please run 'az login' first")
             sys.exit(1)
@@ -228,10 +477,7 @@ class AzureHelper:
     def get_subscription_info(self) -> Dict:
         """Get detailed subscription information."""
         try:
-            result = subprocess.run(
-                ["az", "account", "show"], capture_output=True, text=True, check=True
-            )
-            return json.loads(result.stdout)
+            return dict(self._account())
         except subprocess.CalledProcessError as e:
             print_error(f"Failed to get subscription info: {e}")
             return {}
@@ -240,66 +486,161 @@ class AzureHelper:
             return {}
 
     def check_azure_cli_auth(self) -> bool:
-        """Check if Azure CLI is authenticated."""
-        try:
-            subprocess.run(
-                ["az", "account", "show"], capture_output=True, text=True, check=True
-            )
-            return True
-        except subprocess.CalledProcessError:
-            return False
-        except FileNotFoundError:
-            print_error("Azure CLI not found")
-            return False
+        """Check if Azure CLI is authenticated, remembering the answer."""
+        if self._auth_ok is None:
+            try:
+                self._account()
+                self._auth_ok = True
+            except (subprocess.CalledProcessError, json.JSONDecodeError):
+                self._auth_ok = False
+            except FileNotFoundError:
+                print_error("Azure CLI not found")
+                self._auth_ok = False
+        return self._auth_ok
+
+    def iter_resource_groups(self, name_filter: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield resource group names as they arrive, optionally filtered by name.
+
+        Raises:
+            subprocess.CalledProcessError: If the Azure CLI listing fails
+        """
+        sdk = self._sdk()
+        if sdk:
+            # ARM only supports tag filters on resource group listings, so the
+            # name match has to happen client-side.
+            for rg in sdk[0].resource_groups.list():
+                if not name_filter or name_filter in rg.name:
+                    yield rg.name
+            return
+
+        # Let the CLI do the substring match so only matching names come back.
+        query = "[].name"
+        if name_filter:
+            query = f"[?contains(name, {jmespath_literal(name_filter)})].name"
+
+        yield from stream_command_lines(
+            ["az", "group", "list", "--query", query, "-o", "tsv"]
+        )
 
     def get_resource_groups(self, name_filter: Optional[str] = None) -> List[str]:
         """Get list of resource groups, optionally filtered by name."""
         try:
-            cmd = ["az", "group", "list", "--query", "[].name", "-o", "tsv"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            resource_groups = [
-                rg.strip() for rg in result.stdout.split("\n") if rg.strip()
-            ]
-
-            if name_filter:
-                resource_groups = [rg for rg in resource_groups if name_filter in rg]
-
-            return resource_groups
-        except subprocess.CalledProcessError as e:
+            return list(self.iter_resource_groups(name_filter))
+        except Exception as e:
             print_warning(f"Failed to list resource groups: {e}")
             return []
 
     def resource_group_exists(self, name: str) -> bool:
         """Check if a resource group exists."""
+        sdk = self._sdk()
         try:
+            if sdk:
+                return bool(sdk[0].resource_groups.check_existence(name))
+
+            # Only the exit status matters, so discard the output entirely
             result = subprocess.run(
-                ["az", "group", "show", "--name", name], capture_output=True, text=True
+                ["az", "group", "show", "--name", name],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return result.returncode == 0
         except Exception:
             return False
 
-    def get_locations(self) -> List[str]:
-        """Get list of available Azure locations."""
+    def get_locations(self, refresh: bool = False) -> List[str]:
+        """
+        Get list of available Azure locations.
+
+        Serves the per-user cached list, or the one bundled with these
+        scripts, without calling Azure. A missing or stale cache is refreshed
+        by a detached process; pass refresh=True to query Azure now.
+        """
+        if refresh:
+            try:
+                return self._refresh_locations_cache()
+            except Exception as e:
+                print_warning(f"Failed to list locations: {e}")
+                return list(FALLBACK_LOCATIONS)
+
+        # The cache's mtime records the last refresh attempt, so it is checked
+        # even when the file holds no usable list
         try:
-            result = subprocess.run(
-                ["az", "account", "list-locations", "--query", "[].name", "-o", "tsv"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return [loc.strip() for loc in result.stdout.split("\n") if loc.strip()]
-        except subprocess.CalledProcessError as e:
-            print_warning(f"Failed to list locations: {e}")
+            cache_age = time.time() - LOCATIONS_CACHE_FILE.stat().st_mtime
+        except OSError:
+            cache_age = None
+
+        for path in (LOCATIONS_CACHE_FILE, LOCATIONS_FILE):
+            try:
+                locations = json_loads(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            if cache_age is None or cache_age > LOCATIONS_MAX_AGE:
+                self._start_locations_refresh()
+            return locations
+
+        return self.get_locations(refresh=True)
+
+    def _query_locations(self) -> List[str]:
+        """List location names from Azure, via the SDK or the CLI."""
+        sdk = self._sdk()
+        if sdk:
             return [
-                "eastus",
-                "westus",
-                "westus2",
-                "centralus",
-                "eastus2",
-                "southcentralus",
-            ]  # US regions fallback
+                location.name
+                for location in sdk[1].subscriptions.list_locations(
+                    self.subscription_id
+                )
+            ]
+
+        return list(
+            stream_command_lines(
+                ["az", "account", "list-locations", "--query", "[].name", "-o", "tsv"]
+            )
+        )
+
+    def _refresh_locations_cache(self) -> List[str]:
+        """Query Azure for locations and store them in the per-user cache."""
+        locations = self._query_locations()
+        if locations:
+            write_text_atomic(str(LOCATIONS_CACHE_FILE), json_dumps(locations))
+        return locations
+
+    def _start_locations_refresh(self) -> None:
+        """
+        Refresh the locations cache in a detached process, once per process.
+
+        The refresh outlives the calling script, which neither waits for the
+        Azure CLI nor sees its output. The cache mtime is first set so the
+        next attempt is LOCATIONS_RETRY_DELAY away; a successful refresh
+        rewrites the file and resets it.
+        """
+        with AzureHelper._locations_refresh_lock:
+            if AzureHelper._locations_refresh_started:
+                return
+            AzureHelper._locations_refresh_started = True
+
+        # Best effort: the current list stays in use if any of this fails
+        try:
+            LOCATIONS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            LOCATIONS_CACHE_FILE.touch()
+            attempted = time.time() - LOCATIONS_MAX_AGE + LOCATIONS_RETRY_DELAY
+            os.utime(LOCATIONS_CACHE_FILE, (attempted, attempted))
+
+            if os.name == "posix":
+                detach = {"start_new_session": True}
+            else:
+                detach = {"creationflags": subprocess.DETACHED_PROCESS}
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "--refresh-locations"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                **detach,
+            )
+        except OSError:
+            pass
 
 
 class ConfigManager:
@@ -310,6 +651,8 @@ class ConfigManager:
         self.config_file = config_file or os.path.expanduser(
             "~/.azure-platform-config.json"
         )
+        # Serialized form of what is on disk, used to skip no-op saves
+        self._saved_text: Optional[str] = None
         self.config = self.load_config()
 
     def load_config(self) -> Dict:
@@ -317,18 +660,23 @@ class ConfigManager:
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, "r") as f:
-                    return json.load(f)
+                    config = json_loads(f.read())
+                self._saved_text = json_dumps(config)
+                return config
             except (json.JSONDecodeError, IOError) as e:
                 print_warning(f"Failed to load config: {e}")
 
         return self.get_default_config()
 
     def save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file, atomically and only if it changed."""
+        text = json_dumps(self.config)
+        if text == self._saved_text:
+            return
+
         try:
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=2)
+            write_text_atomic(self.config_file, text)
+            self._saved_text = text
         except IOError as e:
             print_warning(f"Failed to save config: {e}")
 
@@ -352,6 +700,35 @@ class ConfigManager:
         self.save_config()
 
 
+def normalize_package_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503)."""
+    return name.lower().replace("_", "-").replace(".", "-")
+
+
+@functools.lru_cache(maxsize=None)
+def installed_distributions() -> Dict[str, str]:
+    """Map installed distribution names to versions, read in a single pass."""
+    if importlib_metadata is None:
+        return {}
+    return {
+        normalize_package_name(dist.metadata["Name"]): dist.version
+        for dist in importlib_metadata.distributions()
+        if dist.metadata["Name"]
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _python_package_available(package: str) -> bool:
+    """Check a distribution or import name, caching the result."""
+    if normalize_package_name(package) in installed_distributions():
+        return True
+    # find_spec locates the module without executing its top-level code
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 class DependencyChecker:
     """Check and manage script dependencies."""
 
@@ -369,22 +746,13 @@ class DependencyChecker:
     @staticmethod
     def check_command(command: str) -> bool:
         """Check if a command is available in PATH."""
-        try:
-            subprocess.run(
-                [command, "--version"], capture_output=True, text=True, check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        # A PATH lookup avoids starting the tool (az takes seconds to boot)
+        return shutil.which(command) is not None
 
     @staticmethod
     def check_python_package(package: str) -> bool:
         """Check if a Python package is installed."""
-        try:
-            __import__(package)
-            return True
-        except ImportError:
-            return False
+        return _python_package_available(package)
 
     @staticmethod
     def install_python_package(package: str) -> bool:
@@ -405,6 +773,8 @@ class DependencyChecker:
                 text=True,
                 check=True,
             )
+            installed_distributions.cache_clear()
+            _python_package_available.cache_clear()
             return True
         except subprocess.CalledProcessError as e:
             print_error(f"Failed to install {package}: {e}")
@@ -439,14 +809,9 @@ class DependencyChecker:
                 for line in f:
                     line = line.strip()
                     if line and not line.startswith("#"):
-                        # Extract package name (before == or >= etc.)
-                        package_name = (
-                            line.split("==")[0]
-                            .split(">=")[0]
-                            .split("<=")[0]
-                            .split("~=")[0]
-                            .strip()
-                        )
+                        # Extract package name (before ==, >=, extras, markers etc.)
+                        match = REQUIREMENT_NAME_PATTERN.match(line)
+                        package_name = match.group(1) if match else ""
                         if package_name and not DependencyChecker.check_python_package(
                             package_name
                         ):
@@ -494,6 +859,8 @@ class DependencyChecker:
                 text=True,
                 check=True,
             )
+            installed_distributions.cache_clear()
+            _python_package_available.cache_clear()
             print_success("Packages installed successfully")
             return True
         except subprocess.CalledProcessError as e:
@@ -524,7 +891,7 @@ class DependencyChecker:
 
 def format_json_output(data: Dict, indent: int = 2) -> str:
     """Format dictionary as pretty JSON string."""
-    return json.dumps(data, indent=indent, default=str)
+    return json_dumps(data, indent=indent)
 
 
 def safe_run_command(
@@ -554,6 +921,14 @@ def get_project_root() -> str:
 
 # Example usage and testing
 if __name__ == "__main__":
+    # Started detached by AzureHelper._start_locations_refresh
+    if sys.argv[1:] == ["--refresh-locations"]:
+        try:
+            refresh_locations_cache()
+        except (subprocess.CalledProcessError, OSError):
+            sys.exit(1)
+        sys.exit(0)
+
     print_status("Testing Azure Utilities Module")
 
     # Test dependency checker
@@ -17,55 +17,23 @@ Features:
     - Shows environment information
 """
 
+import functools
 import importlib.util
-import os
 import subprocess
 import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-
-def print_status(message: str) -> None:
-    """Print status message with blue color."""
-    print(f"\033[0;34m[INFO]\033[0m {message}")
-
-
-def print_success(message: str) -> None:
-    """Print success message with green color."""
-    print(f"\033[0;32m[SUCCESS]\033[0m {message}")
-
-
-def print_warning(message: str) -> None:
-    """Print warning message with yellow color."""
-    print(f"\033[1;33m[WARNING]\033[0m {message}")
-
-
-def print_error(message: str) -> None:
-    """Print error message with red color."""
-    print(f"\033[0;31m[ERROR]\033[0m {message}")
-
-
-def is_virtual_environment() -> Tuple[bool, Optional[str]]:
-    """
-    Check if running in a virtual environment.
-
-    Returns:
-        Tuple of (is_venv, venv_path)
-    """
-    # Check for virtual environment indicators
-    if hasattr(sys, "real_prefix"):
-        # virtualenv
-        return True, getattr(sys, "real_prefix", None)
-
-    if hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix:
-        # venv
-        return True, sys.prefix
-
-    # Check environment variables
-    if os.environ.get("VIRTUAL_ENV"):
-        return True, os.environ.get("VIRTUAL_ENV")
-
-    return False, None
+from azure_utils import (
+    REQUIREMENT_NAME_PATTERN,
+    VirtualEnvironmentChecker,
+    installed_distributions,
+    normalize_package_name,
+    print_error,
+    print_status,
+    print_success,
+    print_warning,
+)
 
 
 def check_python_version() -> Tuple[bool, str]:
@@ -84,6 +52,7 @@ def check_python_version() -> Tuple[bool, str]:
     return is_compatible, version_string
 
 
+@functools.lru_cache(maxsize=None)
 def check_package_installed(package_name: str) -> Tuple[bool, Optional[str]]:
     """
     Check if a package is installed and get its version.
@@ -94,7 +63,11 @@ def check_package_installed(package_name: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_installed, version)
     """
-    # Map pip package names to their import names
+    version = installed_distributions().get(normalize_package_name(package_name))
+    if version is not None:
+        return True, version
+
+    # Not found as a distribution; map pip package names to their import names
     package_import_map = {
         "pyyaml": "yaml",
         "python-dateutil": "dateutil",
@@ -111,17 +84,10 @@ def check_package_installed(package_name: str) -> Tuple[bool, Optional[str]]:
     import_name = package_import_map.get(package_name, package_name)
 
     try:
-        spec = importlib.util.find_spec(import_name)
-        if spec is None:
-            return False, None
-
-        # Try to get version
-        try:
-            module = importlib.import_module(import_name)
-            version = getattr(module, "__version__", "unknown")
-            return True, version
-        except ImportError:
+        # find_spec locates the package without executing its code
+        if importlib.util.find_spec(import_name) is None:
             return False, None
+        return True, "unknown"
     except (ImportError, AttributeError, ValueError):
         return False, None
 
@@ -165,14 +131,9 @@ def check_requirements_file() -> Tuple[bool, List[str]]:
         for line in lines:
             line = line.strip()
             if line and not line.startswith("#"):
-                # Extract package name (before == or >= etc.)
-                package_name = (
-                    line.split("==")[0]
-                    .split(">=")[0]
-                    .split("<=")[0]
-                    .split("~=")[0]
-                    .strip()
-                )
+                # Extract package name (before ==, >=, extras, markers etc.)
+                match = REQUIREMENT_NAME_PATTERN.match(line)
+                package_name = match.group(1) if match else ""
                 if package_name:
                     packages.append(package_name)
 
@@ -181,26 +142,6 @@ def check_requirements_file() -> Tuple[bool, List[str]]:
         return False, []
 
 
-def find_virtual_environments() -> List[str]:
-    """Find potential virtual environment directories."""
-    project_root = Path(__file__).parent.parent
-    venv_dirs = []
-
-    # Common virtual environment directory names
-    common_names = ["venv", ".venv", "env", ".env", "virtualenv"]
-
-    for name in common_names:
-        venv_path = project_root / name
-        if venv_path.exists() and venv_path.is_dir():
-            # Check if it looks like a virtual environment
-            if (venv_path / "bin" / "activate").exists() or (
-                venv_path / "Scripts" / "activate"
-            ).exists():
-                venv_dirs.append(str(venv_path))
-
-    return venv_dirs
-
-
 def main():
     """Main function to check Python environment."""
     print("Python Environment Checker for Azure AKS GitOps Platform")
@@ -217,14 +158,14 @@ def main():
         return 1
 
     # Check virtual environment
-    is_venv, venv_path = is_virtual_environment()
+    is_venv, venv_path = VirtualEnvironmentChecker.is_virtual_environment()
     if is_venv:
         print_success(f"Virtual environment: Active ({venv_path})")
     else:
         print_warning("Virtual environment: Not active")
 
         # Look for existing virtual environments
-        found_venvs = find_virtual_environments()
+        found_venvs = VirtualEnvironmentChecker.find_virtual_environments()
         if found_venvs:
             print_status("Found existing virtual environments:")
             for venv_dir in found_venvs:
@@ -25,12 +25,38 @@ Examples:
 """
 
 import argparse
+import functools
 import json
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Written above the pip freeze output by the freeze command
+FROZEN_REQUIREMENTS_HEADER = (
+    b"# Frozen requirements generated by manage-dependencies.py\n"
+    b"# This file contains exact versions of all installed packages\n"
+    b"# Install with: pip install -r requirements-frozen.txt\n\n"
+)
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Each non-blank, non-comment line of a requirements file, with its package
+# name, version operator and version when the line starts with a specifier
+REQUIREMENTS_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*(?=[^\s#])(?P<line>"
+    r"(?:(?P<name>[a-zA-Z0-9_-]+)(?P<operator>[><=!~]+)"
+    r"(?P<version>[0-9.]+(?:[^\n]*[^\s])?)?)?"
+    r"[^\n]*?)[^\S\n]*$",
+    re.MULTILINE,
+)
 
 
 def print_status(message: str) -> None:
@@ -53,6 +79,45 @@ def print_error(message: str) -> None:
     print(f"\033[0;31m[ERROR]\033[0m {message}")
 
 
+def write_lines(lines: Iterable[str]) -> None:
+    """Write lines to stdout in a single write call."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_requirements_cached(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Dict[str, str], ...]:
+    """Parse a requirements file; the stat arguments only key the cache."""
+    text = Path(path).read_text()
+
+    # One regex scan over the whole file; line numbers are counted
+    # incrementally between matches
+    packages = []
+    line_num, counted_to = 1, 0
+    for match in REQUIREMENTS_LINE_PATTERN.finditer(text):
+        line_num += text.count("\n", counted_to, match.start())
+        counted_to = match.start()
+        line = match.group("line")
+
+        if match.group("name"):
+            packages.append(
+                {
+                    "name": match.group("name"),
+                    "operator": match.group("operator"),
+                    "version": match.group("version") or "",
+                    "line": line,
+                    "line_number": line_num,
+                }
+            )
+        else:
+            print_warning(
+                f"Could not parse line {line_num} in {Path(path).name}: {line}"
+            )
+
+    return tuple(packages)
+
+
 class DependencyManager:
     """Manages Python dependencies for the project."""
 
@@ -64,83 +129,90 @@ class DependencyManager:
             "dev": self.script_dir / "requirements-dev.txt",
             "test": self.script_dir / "requirements-test.txt",
         }
+        # pip list results, kept so each listing runs at most once per process
+        self._installed_cache: Optional[Dict[str, str]] = None
+        self._outdated_cache: Optional[List[Dict[str, str]]] = None
+        self._in_venv: Optional[bool] = None
 
     def run_command(
-        self, cmd: List[str], capture_output: bool = True
+        self, cmd: List[str], capture_output: bool = True, binary: bool = False
     ) -> subprocess.CompletedProcess:
-        """Run a command and return the result."""
+        """
+        Run a command and return the result.
+
+        With binary=True the output is left as bytes, for callers that write
+        it straight to a file and would otherwise decode it only to re-encode.
+        """
         try:
             return subprocess.run(
-                cmd, capture_output=capture_output, text=True, check=True
+                cmd, capture_output=capture_output, text=not binary, check=True
             )
         except subprocess.CalledProcessError as e:
             print_error(f"Command failed: {' '.join(cmd)}")
-            if e.stdout:
-                print(f"STDOUT: {e.stdout}")
-            if e.stderr:
-                print(f"STDERR: {e.stderr}")
+            stdout, stderr = e.stdout, e.stderr
+            if binary:
+                stdout = stdout.decode(errors="replace") if stdout else stdout
+                stderr = stderr.decode(errors="replace") if stderr else stderr
+            if stdout:
+                print(f"STDOUT: {stdout}")
+            if stderr:
+                print(f"STDERR: {stderr}")
             raise
 
     def check_virtual_environment(self) -> bool:
-        """Check if running in a virtual environment."""
-        return hasattr(sys, "real_prefix") or (
-            hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
-        )
+        """Check if running in a virtual environment (computed once)."""
+        if self._in_venv is None:
+            self._in_venv = hasattr(sys, "real_prefix") or (
+                hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
+            )
+        return self._in_venv
 
     def parse_requirements_file(self, file_path: Path) -> List[Dict[str, str]]:
         """Parse a requirements file and return package information."""
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return []
 
-        packages = []
-        with open(file_path, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    # Parse package specification
-                    match = re.match(r"^([a-zA-Z0-9_-]+)([><=!~]+)([0-9.]+.*)?", line)
-                    if match:
-                        name, operator, version = match.groups()
-                        packages.append(
-                            {
-                                "name": name,
-                                "operator": operator,
-                                "version": version or "",
-                                "line": line,
-                                "line_number": line_num,
-                            }
-                        )
-                    else:
-                        print_warning(
-                            f"Could not parse line {line_num} in {file_path.name}: {line}"
-                        )
-
-        return packages
+        # Keyed on mtime and size, so an edited file is parsed again
+        return list(
+            _parse_requirements_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+        )
 
     def get_installed_packages(self) -> Dict[str, str]:
         """Get currently installed packages and their versions."""
+        if self._installed_cache is not None:
+            return self._installed_cache
+
         try:
             result = self.run_command(
                 [sys.executable, "-m", "pip", "list", "--format=json"]
             )
-            packages = json.loads(result.stdout)
-            return {pkg["name"].lower(): pkg["version"] for pkg in packages}
+            packages = json_loads(result.stdout)
+            self._installed_cache = {
+                pkg["name"].lower(): pkg["version"] for pkg in packages
+            }
+            return self._installed_cache
         except (subprocess.CalledProcessError, json.JSONDecodeError):
             print_error("Failed to get installed packages")
             return {}
 
     def get_outdated_packages(self) -> List[Dict[str, str]]:
         """Get list of outdated packages."""
+        if self._outdated_cache is not None:
+            return self._outdated_cache
+
         try:
             result = self.run_command(
                 [sys.executable, "-m", "pip", "list", "--outdated", "--format=json"]
             )
-            return json.loads(result.stdout)
+            self._outdated_cache = json_loads(result.stdout)
+            return self._outdated_cache
         except (subprocess.CalledProcessError, json.JSONDecodeError):
             print_error("Failed to get outdated packages")
             return []
 
-    def check_dependencies(self) -> None:
+    def check_dependencies(self, with_outdated: bool = False) -> None:
         """Check current dependencies and their status."""
         print_status("Checking dependencies...")
 
@@ -151,7 +223,23 @@ class DependencyManager:
             )
             return
 
-        installed_packages = self.get_installed_packages()
+        # The pip listing and the file parses are independent, so run them
+        # together and report the results in the usual order
+        with ThreadPoolExecutor(
+            max_workers=len(self.requirements_files) + 1
+        ) as executor:
+            installed_future = executor.submit(self.get_installed_packages)
+            parsed = dict(
+                zip(
+                    self.requirements_files,
+                    executor.map(
+                        self.parse_requirements_file,
+                        self.requirements_files.values(),
+                    ),
+                )
+            )
+            installed_packages = installed_future.result()
+
         print_success(f"Found {len(installed_packages)} installed packages")
 
         for req_type, req_file in self.requirements_files.items():
@@ -161,7 +249,7 @@ class DependencyManager:
                 )
                 continue
 
-            packages = self.parse_requirements_file(req_file)
+            packages = parsed[req_type]
             print_status(
                 f"{req_type.title()} requirements ({req_file.name}): {len(packages)} packages"
             )
@@ -179,6 +267,36 @@ class DependencyManager:
             else:
                 print_success(f"All {req_type} packages are installed")
 
+        if with_outdated:
+            self.show_outdated()
+
+    def run_pip_audit(self) -> List[Tuple[str, str]]:
+        """
+        Run pip-audit and return (package, vulnerability id) pairs.
+
+        pip-audit exits with status 1 when it finds vulnerabilities, so that
+        status still carries a report.
+
+        Raises:
+            subprocess.CalledProcessError: If pip-audit is missing or fails
+        """
+        cmd = [sys.executable, "-m", "pip_audit", "--format=json"]
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode not in (0, 1) or not result.stdout.strip():
+            raise subprocess.CalledProcessError(
+                result.returncode, cmd, result.stdout, result.stderr
+            )
+
+        report = json_loads(result.stdout)
+        # Newer pip-audit wraps the dependency list in an object
+        if isinstance(report, dict):
+            report = report.get("dependencies", [])
+        return [
+            (dependency.get("name", "unknown"), vuln.get("id", "unknown"))
+            for dependency in report
+            for vuln in dependency.get("vulns", ())
+        ]
+
     def audit_security(self) -> None:
         """Run security audit on dependencies."""
         print_status("Running security audit...")
@@ -190,17 +308,14 @@ class DependencyManager:
         # Try pip-audit first
         try:
             print_status("Running pip-audit...")
-            result = self.run_command(
-                [sys.executable, "-m", "pip-audit", "--format=json"]
-            )
-            audit_results = json.loads(result.stdout)
+            audit_results = self.run_pip_audit()
 
             if audit_results:
                 print_error(f"Found {len(audit_results)} security vulnerabilities")
-                for vuln in audit_results[:5]:  # Show first 5
-                    print(
-                        f"  - {vuln.get('package', 'unknown')}: {vuln.get('vulnerability_id', 'unknown')}"
-                    )
+                write_lines(
+                    f"  - {package}: {vuln_id}"
+                    for package, vuln_id in audit_results[:5]  # Show first 5
+                )
             else:
                 print_success("No security vulnerabilities found")
 
@@ -212,14 +327,14 @@ class DependencyManager:
                 result = self.run_command(
                     [sys.executable, "-m", "safety", "check", "--json"]
                 )
-                safety_results = json.loads(result.stdout)
+                safety_results = json_loads(result.stdout)
 
                 if safety_results:
                     print_error(f"Found {len(safety_results)} security issues")
-                    for issue in safety_results[:5]:  # Show first 5
-                        print(
-                            f"  - {issue.get('package', 'unknown')}: {issue.get('vulnerability', 'unknown')}"
-                        )
+                    write_lines(
+                        f"  - {issue.get('package', 'unknown')}: {issue.get('vulnerability', 'unknown')}"
+                        for issue in safety_results[:5]  # Show first 5
+                    )
                 else:
                     print_success("No security issues found")
 
@@ -239,8 +354,10 @@ class DependencyManager:
 
         if outdated:
             print_warning(f"Found {len(outdated)} outdated packages:")
-            for pkg in outdated:
-                print(f"  {pkg['name']}: {pkg['version']} -> {pkg['latest_version']}")
+            write_lines(
+                f"  {pkg['name']}: {pkg['version']} -> {pkg['latest_version']}"
+                for pkg in outdated
+            )
         else:
             print_success("All packages are up to date")
 
@@ -253,7 +370,9 @@ class DependencyManager:
             return
 
         try:
-            result = self.run_command([sys.executable, "-m", "pip", "freeze"])
+            result = self.run_command(
+                [sys.executable, "-m", "pip", "freeze"], binary=True
+            )
             frozen_requirements = result.stdout
 
             if output_file:
@@ -261,13 +380,8 @@ class DependencyManager:
             else:
                 output_path = self.script_dir / "requirements-frozen.txt"
 
-            with open(output_path, "w") as f:
-                f.write("# Frozen requirements generated by manage-dependencies.py\n")
-                f.write(
-                    "# This file contains exact versions of all installed packages\n"
-                )
-                f.write("# Install with: pip install -r requirements-frozen.txt\n\n")
-                f.write(frozen_requirements)
+            with open(output_path, "wb") as f:
+                f.write(FROZEN_REQUIREMENTS_HEADER + frozen_requirements)
 
             print_success(f"Frozen requirements saved to: {output_path}")
 
@@ -297,25 +411,49 @@ class DependencyManager:
         except subprocess.CalledProcessError:
             print_warning("Failed to update pip")
 
-        # Update packages from requirements files
-        for req_type, req_file in self.requirements_files.items():
-            if req_file.exists():
-                print_status(f"Updating {req_type} dependencies...")
-                try:
-                    self.run_command(
-                        [
-                            sys.executable,
-                            "-m",
-                            "pip",
-                            "install",
-                            "--upgrade",
-                            "-r",
-                            str(req_file),
-                        ]
-                    )
-                    print_success(f"{req_type.title()} dependencies updated")
-                except subprocess.CalledProcessError:
-                    print_error(f"Failed to update {req_type} dependencies")
+        # Update packages from all requirements files in one pip run, which
+        # saves a pip startup and resolve per file
+        existing_files = {
+            req_type: req_file
+            for req_type, req_file in self.requirements_files.items()
+            if req_file.exists()
+        }
+        if existing_files:
+            print_status(
+                f"Updating {', '.join(existing_files)} dependencies together..."
+            )
+            cmd = [sys.executable, "-m", "pip", "install", "--upgrade"]
+            for req_file in existing_files.values():
+                cmd += ["-r", str(req_file)]
+            try:
+                self.run_command(cmd)
+                print_success("All dependencies updated")
+                existing_files = {}
+            except subprocess.CalledProcessError:
+                print_warning("Combined update failed, retrying each file")
+
+        # Per-file fallback pinpoints which requirements file fails
+        for req_type, req_file in existing_files.items():
+            print_status(f"Updating {req_type} dependencies...")
+            try:
+                self.run_command(
+                    [
+                        sys.executable,
+                        "-m",
+                        "pip",
+                        "install",
+                        "--upgrade",
+                        "-r",
+                        str(req_file),
+                    ]
+                )
+                print_success(f"{req_type.title()} dependencies updated")
+            except subprocess.CalledProcessError:
+                print_error(f"Failed to update {req_type} dependencies")
+
+        # Installed versions changed, so cached pip listings are stale
+        self._installed_cache = None
+        self._outdated_cache = None
 
 
 def main():
@@ -343,6 +481,12 @@ def main():
         "--output", "-o", type=str, help="Output file for freeze command"
     )
 
+    parser.add_argument(
+        "--with-outdated",
+        action="store_true",
+        help="Also show outdated packages when running check",
+    )
+
     args = parser.parse_args()
 
     if args.command == "help":
@@ -353,7 +497,7 @@ def main():
 
     try:
         if args.command == "check":
-            manager.check_dependencies()
+            manager.check_dependencies(with_outdated=args.with_outdated)
         elif args.command == "update":
             manager.update_dependencies(dry_run=args.dry_run)
         elif args.command == "audit":
@@ -7,17 +7,26 @@ This script analyzes Python scripts to identify their module dependencies,
 helping ensure all required packages are available before execution.
 
 Usage:
-    python3 scripts/module-check.py [script_path]
+    python3 scripts/module-check.py [script_path] [--deep]
     python3 scripts/module-check.py  # Defaults to setup-azure-credentials.py
 
     Analyze specific script:
     python3 scripts/module-check.py ./scripts/dynamic-cost-estimator.py
+
+    Resolve the full transitive import graph (slow):
+    python3 scripts/module-check.py ./scripts/azure-cost-monitor.py --deep
 """
 
+import argparse
 import ast
+import functools
+import hashlib
+import importlib.util
+import json
 import os
 import re
 import sys
+from itertools import islice
 from modulefinder import ModuleFinder
 from pathlib import Path
 
@@ -49,64 +58,232 @@ except ImportError:
         print(f"[ERROR] {msg}")
 
 
-def analyze_imports_manually(script_path):
+# Top-level names of well-known third-party packages
+KNOWN_THIRDPARTY = frozenset(
+    {
+        "requests",
+        "numpy",
+        "pandas",
+        "flask",
+        "django",
+        "boto3",
+        "azure",
+        "google",
+        "aws",
+        "click",
+        "pyyaml",
+        "jinja2",
+        "sqlalchemy",
+        "pytest",
+        "matplotlib",
+        "scipy",
+        "sklearn",
+        "tensorflow",
+        "torch",
+        "fastapi",
+    }
+)
+
+# Import names mapped to the pip packages that provide them
+PACKAGE_MAPPINGS = {
+    "azure": "azure-cli",
+    "azure.identity": "azure-identity",
+    "azure.mgmt": "azure-mgmt",
+    "requests": "requests",
+    "boto3": "boto3",
+    "google": "google-cloud",
+    "yaml": "PyYAML",
+    "jwt": "PyJWT",
+    "dateutil": "python-dateutil",
+}
+
+# Import scans are stored here, keyed on script content and environment
+MODULE_CHECK_CACHE_FILE = (
+    Path.home() / ".cache" / "azure-platform" / "module-check.json"
+)
+MODULE_CHECK_CACHE_ENTRIES = 64
+
+# Case-insensitive substring classifiers for module names, one regex scan each
+LIKELY_THIRDPARTY_PATTERN = re.compile("azure|boto|google|aws", re.IGNORECASE)
+LIKELY_SYSTEM_PATTERN = re.compile("win|posix|_|nt", re.IGNORECASE)
+INSTALLABLE_PATTERN = re.compile("azure|requests|boto|google", re.IGNORECASE)
+CRITICAL_PATTERN = re.compile("azure|requests", re.IGNORECASE)
+
+
+class MockModule:
+    """Stand-in for a ModuleFinder module, so the printers accept both."""
+
+    def __init__(self, name, origin):
+        self.name = name
+        self.globalnames = {}
+        self.__file__ = origin
+
+
+@functools.lru_cache(maxsize=None)
+def find_module_origin(module_name):
+    """
+    Locate a module without executing it.
+
+    Args:
+        module_name (str): Dotted module name
+
+    Returns:
+        str: The module's file path, or a placeholder for modules without
+            one (built-ins, namespace packages); None if it cannot be found
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+
+    if spec is None:
+        return None
+    if spec.has_location and spec.origin:
+        return spec.origin
+    return f"<module '{module_name}'>"
+
+
+def collect_imports(tree):
     """
-    Manually analyze imports when ModuleFinder fails.
+    Collect the names of all modules imported in a parsed script.
+
+    Imports are statements, so only statement bodies are visited and the
+    expression subtrees that make up most of the AST are skipped. Function
+    and class bodies are included, since lazily imported modules are still
+    dependencies.
+
+    Args:
+        tree (ast.Module): Parsed script
+
+    Returns:
+        set: Imported module names
+    """
+    imports = set()
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.add(node.module)
+        else:
+            for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+                stack.extend(getattr(node, field, ()))
+    return imports
+
+
+def analysis_cache_key(content):
+    """
+    Key an import analysis on the script content and the Python environment.
+
+    The newest mtime among the sys.path directories changes whenever
+    packages are installed or removed, which retires stale results.
+
+    Args:
+        content (bytes): Script source
+
+    Returns:
+        str: Hex digest identifying the analysis
+    """
+    digest = hashlib.blake2b(content, digest_size=16)
+    newest = 0
+    for entry in sys.path:
+        try:
+            newest = max(newest, os.stat(entry or ".").st_mtime_ns)
+        except OSError:
+            pass
+    digest.update(f"{sys.version}|{sys.prefix}|{newest}".encode())
+    return digest.hexdigest()
+
+
+def read_analysis_cache():
+    """Read the stored analyses, or an empty dict if there are none."""
+    try:
+        with open(MODULE_CHECK_CACHE_FILE, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def load_cached_analysis(cache_key):
+    """Return the stored analysis for a cache key, or None."""
+    return read_analysis_cache().get(cache_key)
+
+
+def save_cached_analysis(cache_key, result):
+    """Store an analysis, keeping only the most recent entries."""
+    entries = read_analysis_cache()
+    entries.pop(cache_key, None)
+    entries[cache_key] = result
+    while len(entries) > MODULE_CHECK_CACHE_ENTRIES:
+        del entries[next(iter(entries))]
+
+    # The cache is only an optimization, so write failures are ignored
+    try:
+        MODULE_CHECK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = MODULE_CHECK_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, MODULE_CHECK_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def analyze_imports_manually(script_path, use_cache=True):
+    """
+    Analyze a script's own imports from its AST.
+
+    Only the script's direct imports are examined, so this is fast compared
+    with ModuleFinder, which loads the whole transitive import graph.
 
     Args:
         script_path (str): Path to the Python script to analyze
+        use_cache (bool): Reuse a stored result for unchanged scripts
 
     Returns:
         tuple: (found_imports, missing_modules, script_info)
     """
     try:
-        with open(script_path, "r", encoding="utf-8") as f:
+        with open(script_path, "rb") as f:
             content = f.read()
+            size = os.fstat(f.fileno()).st_size
+
+        cache_key = analysis_cache_key(content) if use_cache else None
+        cached = load_cached_analysis(cache_key) if cache_key else None
 
-        # Parse the AST to find imports
-        tree = ast.parse(content)
-
-        imports = set()
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.add(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.add(node.module)
-
-        # Try to import each module to see if it's available
-        available_modules = {}
-        missing_modules = {}
-
-        for module_name in imports:
-            try:
-                imported_module = __import__(module_name)
-
-                # Create a mock module object for compatibility
-                class MockModule:
-                    def __init__(self, name, real_module):
-                        self.name = name
-                        self.globalnames = {}
-                        # Try to get the real file path
-                        if hasattr(real_module, "__file__") and real_module.__file__:
-                            self.__file__ = real_module.__file__
-                        else:
-                            self.__file__ = f"<module '{name}'>"
-
-                available_modules[module_name] = MockModule(
-                    module_name, imported_module
+        if cached is not None:
+            origins, missing = cached["available"], cached["missing"]
+        else:
+            # Parse the AST to find imports
+            imports = collect_imports(ast.parse(content, filename=script_path))
+
+            # Locate each module to see if it's available
+            origins, missing = {}, []
+            for module_name in imports:
+                origin = find_module_origin(module_name)
+                if origin is None:
+                    missing.append(module_name)
+                else:
+                    origins[module_name] = origin
+
+            if cache_key:
+                save_cached_analysis(
+                    cache_key, {"available": origins, "missing": missing}
                 )
-            except ImportError:
-                missing_modules[module_name] = ["Import failed"]
+
+        available_modules = {
+            name: MockModule(name, origin) for name, origin in origins.items()
+        }
+        missing_modules = {name: ["Import failed"] for name in missing}
 
         script_info = {
             "path": script_path,
-            "size": os.path.getsize(script_path),
+            "size": size,
             "exists": True,
         }
 
-        print("Note: Using manual import analysis due to ModuleFinder issues")
         return available_modules, missing_modules, script_info
 
     except Exception as e:
@@ -114,12 +291,15 @@ def analyze_imports_manually(script_path):
         return None, None, None
 
 
-def analyze_script_dependencies(script_path):
+def analyze_script_dependencies(script_path, deep=False, use_cache=True):
     """
     Analyze a Python script to find its module dependencies.
 
     Args:
         script_path (str): Path to the Python script to analyze
+        deep (bool): Use ModuleFinder to walk the transitive import graph
+            instead of scanning the script's own imports
+        use_cache (bool): Reuse a stored import scan for unchanged scripts
 
     Returns:
         tuple: (loaded_modules, missing_modules, script_info)
@@ -132,8 +312,6 @@ def analyze_script_dependencies(script_path):
     print("=" * 60)
 
     try:
-        finder = ModuleFinder()
-
         # Check if the file is actually a Python script
         with open(script_path, "r", encoding="utf-8") as f:
             first_line = f.readline().strip()
@@ -142,6 +320,10 @@ def analyze_script_dependencies(script_path):
             ) and not script_path.endswith(".py"):
                 print(f"Warning: {script_path} may not be a Python script")
 
+        if not deep:
+            return analyze_imports_manually(script_path, use_cache=use_cache)
+
+        finder = ModuleFinder()
         finder.run_script(script_path)
 
         # Get script info
@@ -166,7 +348,8 @@ def analyze_script_dependencies(script_path):
                 "This often happens with complex import patterns or missing dependencies."
             )
             print("Trying alternative analysis...")
-            return analyze_imports_manually(script_path)
+            print("Note: Using manual import analysis due to ModuleFinder issues")
+            return analyze_imports_manually(script_path, use_cache=use_cache)
         else:
             print(f"Attribute error analyzing script: {e}")
             return None, None, None
@@ -176,6 +359,52 @@ def analyze_script_dependencies(script_path):
         return None, None, None
 
 
+def categorize_module(name, mod):
+    """
+    Classify a found module as standard library, third-party or local.
+
+    Args:
+        name (str): Module name
+        mod: ModuleFinder module or MockModule
+
+    Returns:
+        str: "stdlib", "thirdparty" or "local"
+    """
+    file_path = getattr(mod, "__file__", None)
+
+    # Known third-party package names win regardless of location
+    if name.partition(".")[0] in KNOWN_THIRDPARTY:
+        return "thirdparty"
+    if not file_path:
+        return "stdlib"
+    if "site-packages" in file_path:
+        return "thirdparty"
+    if name.startswith(".") or "scripts" in file_path:
+        return "local"
+    return "stdlib"
+
+
+def print_module_group(title, group):
+    """
+    Print one category of modules with a preview of their global names.
+
+    Args:
+        title (str): Heading for the category
+        group (list): (name, module) pairs
+    """
+    if not group:
+        return
+
+    print(f"\n{title}:")
+    for name, mod in sorted(group):
+        # islice stops after the preview instead of copying every key
+        globals_str = ", ".join(islice(mod.globalnames, 3))
+        global_count = len(mod.globalnames)
+        if global_count > 3:
+            globals_str += f" ... (+{global_count - 3} more)"
+        print(f"  {name}: {globals_str}")
+
+
 def print_loaded_modules(modules):
     """Print information about successfully loaded modules."""
     print("\nSuccessfully Loaded Modules:")
@@ -186,80 +415,18 @@ def print_loaded_modules(modules):
     thirdparty_modules = []
     local_modules = []
 
-    # Known third-party packages
-    known_thirdparty = {
-        "requests",
-        "numpy",
-        "pandas",
-        "flask",
-        "django",
-        "boto3",
-        "azure",
-        "google",
-        "aws",
-        "click",
-        "pyyaml",
-        "jinja2",
-        "sqlalchemy",
-        "pytest",
-        "matplotlib",
-        "scipy",
-        "sklearn",
-        "tensorflow",
-        "torch",
-        "fastapi",
+    categories = {
+        "stdlib": stdlib_modules,
+        "thirdparty": thirdparty_modules,
+        "local": local_modules,
     }
-
     for name, mod in modules.items():
-        root_name = name.split(".")[0]
-
-        if hasattr(mod, "__file__") and mod.__file__:
-            if "site-packages" in mod.__file__ or root_name in known_thirdparty:
-                thirdparty_modules.append((name, mod))
-            elif name.startswith(".") or "scripts" in mod.__file__:
-                local_modules.append((name, mod))
-            else:
-                stdlib_modules.append((name, mod))
-        else:
-            # Check if it's a known third-party package
-            if root_name in known_thirdparty:
-                thirdparty_modules.append((name, mod))
-            else:
-                stdlib_modules.append((name, mod))
+        categories[categorize_module(name, mod)].append((name, mod))
 
     # Print categorized modules
-    if stdlib_modules:
-        print("\nStandard Library Modules:")
-        for name, mod in sorted(stdlib_modules):
-            globals_preview = (
-                list(mod.globalnames.keys())[:3] if mod.globalnames else []
-            )
-            globals_str = ", ".join(globals_preview)
-            if len(mod.globalnames) > 3:
-                globals_str += f" ... (+{len(mod.globalnames) - 3} more)"
-            print(f"  {name}: {globals_str}")
-
-    if thirdparty_modules:
-        print("\nThird-party Modules:")
-        for name, mod in sorted(thirdparty_modules):
-            globals_preview = (
-                list(mod.globalnames.keys())[:3] if mod.globalnames else []
-            )
-            globals_str = ", ".join(globals_preview)
-            if len(mod.globalnames) > 3:
-                globals_str += f" ... (+{len(mod.globalnames) - 3} more)"
-            print(f"  {name}: {globals_str}")
-
-    if local_modules:
-        print("\nLocal Modules:")
-        for name, mod in sorted(local_modules):
-            globals_preview = (
-                list(mod.globalnames.keys())[:3] if mod.globalnames else []
-            )
-            globals_str = ", ".join(globals_preview)
-            if len(mod.globalnames) > 3:
-                globals_str += f" ... (+{len(mod.globalnames) - 3} more)"
-            print(f"  {name}: {globals_str}")
+    print_module_group("Standard Library Modules", stdlib_modules)
+    print_module_group("Third-party Modules", thirdparty_modules)
+    print_module_group("Local Modules", local_modules)
 
 
 def print_missing_modules(badmodules):
@@ -277,11 +444,9 @@ def print_missing_modules(badmodules):
     likely_system = []
 
     for module_name in sorted(badmodules.keys()):
-        if any(
-            pkg in module_name.lower() for pkg in ["azure", "boto", "google", "aws"]
-        ):
+        if LIKELY_THIRDPARTY_PATTERN.search(module_name):
             likely_thirdparty.append(module_name)
-        elif any(pkg in module_name.lower() for pkg in ["win", "posix", "_", "nt"]):
+        elif LIKELY_SYSTEM_PATTERN.search(module_name):
             likely_system.append(module_name)
         else:
             likely_optional.append(module_name)
@@ -308,43 +473,24 @@ def generate_requirements(modules, badmodules):
     print("\nSuggested requirements.txt entries:")
     print("-" * 40)
 
-    # Common package mappings
-    package_mappings = {
-        "azure": "azure-cli",
-        "azure.identity": "azure-identity",
-        "azure.mgmt": "azure-mgmt",
-        "requests": "requests",
-        "boto3": "boto3",
-        "google": "google-cloud",
-        "yaml": "PyYAML",
-        "jwt": "PyJWT",
-        "dateutil": "python-dateutil",
-    }
-
     suggested_packages = set()
 
     # Check loaded third-party modules
     for name, mod in modules.items():
-        if (
-            hasattr(mod, "__file__")
-            and mod.__file__
-            and "site-packages" in mod.__file__
-        ):
-            root_package = name.split(".")[0]
-            if root_package in package_mappings:
-                suggested_packages.add(package_mappings[root_package])
+        file_path = getattr(mod, "__file__", None)
+        if file_path and "site-packages" in file_path:
+            root_package = name.partition(".")[0]
+            if root_package in PACKAGE_MAPPINGS:
+                suggested_packages.add(PACKAGE_MAPPINGS[root_package])
             elif not root_package.startswith("_"):
                 suggested_packages.add(root_package)
 
     # Check missing modules that might be installable
     for module_name in badmodules.keys():
-        root_package = module_name.split(".")[0]
-        if root_package in package_mappings:
-            suggested_packages.add(package_mappings[root_package])
-        elif any(
-            pkg in root_package.lower()
-            for pkg in ["azure", "requests", "boto", "google"]
-        ):
+        root_package = module_name.partition(".")[0]
+        if root_package in PACKAGE_MAPPINGS:
+            suggested_packages.add(PACKAGE_MAPPINGS[root_package])
+        elif INSTALLABLE_PATTERN.search(root_package):
             suggested_packages.add(root_package)
 
     if suggested_packages:
@@ -354,8 +500,66 @@ def generate_requirements(modules, badmodules):
         print("  No additional packages required (uses only standard library)")
 
 
+def find_default_script():
+    """
+    Pick the script to analyze when none is given on the command line.
+
+    Returns:
+        str: setup-azure-credentials.py if present, else the first Python
+            script in ./scripts; None if there is none
+    """
+    default_script = "./scripts/setup-azure-credentials.py"
+
+    # Check if default script exists, if not suggest alternatives
+    if os.path.exists(default_script):
+        return default_script
+
+    print(f"Default script not found: {default_script}")
+    # Look for Python scripts in the scripts directory
+    scripts_dir = "./scripts"
+    if not os.path.exists(scripts_dir):
+        return default_script
+
+    with os.scandir(scripts_dir) as entries:
+        python_scripts = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".py") and entry.is_file()
+        ]
+    if not python_scripts:
+        print("No Python scripts found in scripts directory")
+        return None
+
+    print("Available Python scripts:")
+    for script in python_scripts:
+        print(f"  - {script}")
+    default_script = os.path.join(scripts_dir, python_scripts[0])
+    print(f"Using: {default_script}")
+    return default_script
+
+
 def main():
     """Main function to run the module dependency analysis."""
+    parser = argparse.ArgumentParser(
+        description="Module Dependency Checker for Azure AKS GitOps Platform Scripts"
+    )
+    parser.add_argument(
+        "script_path",
+        nargs="?",
+        help="Python script to analyze (defaults to setup-azure-credentials.py)",
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Resolve the full transitive import graph with ModuleFinder (slow)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-scan imports even if a cached result exists",
+    )
+    args = parser.parse_args()
+
     print("Module Dependency Checker for Azure AKS GitOps Platform")
     print("=" * 60)
     print()
@@ -367,37 +571,19 @@ def main():
         VirtualEnvironmentChecker.check_and_warn_virtual_environment()
         print()
 
-    # Default script to analyze
-    default_script = "./scripts/setup-azure-credentials.py"
-
-    # Check if default script exists, if not suggest alternatives
-    if not os.path.exists(default_script):
-        print(f"Default script not found: {default_script}")
-        # Look for Python scripts in the scripts directory
-        scripts_dir = "./scripts"
-        if os.path.exists(scripts_dir):
-            python_scripts = [f for f in os.listdir(scripts_dir) if f.endswith(".py")]
-            if python_scripts:
-                print("Available Python scripts:")
-                for script in python_scripts:
-                    print(f"  - {script}")
-                default_script = os.path.join(scripts_dir, python_scripts[0])
-                print(f"Using: {default_script}")
-            else:
-                print("No Python scripts found in scripts directory")
-                return
-
-    # Get script path from command line or use default
-    if len(sys.argv) > 1:
-        script_path = sys.argv[1]
-    else:
-        script_path = default_script
+    # Get script path from command line or use default; the scripts
+    # directory is only searched when no path was given
+    script_path = args.script_path or find_default_script()
+    if script_path is None:
+        return
 
     # Convert to absolute path
     script_path = os.path.abspath(script_path)
 
     # Analyze the script
-    modules, badmodules, script_info = analyze_script_dependencies(script_path)
+    modules, badmodules, script_info = analyze_script_dependencies(
+        script_path, deep=args.deep, use_cache=not args.no_cache
+    )
 
     if modules is None:
         sys.exit(1)
@@ -417,11 +603,7 @@ def main():
     print("Module dependency analysis complete!")
 
     # Exit with error code if there are missing critical modules
-    critical_missing = [
-        m
-        for m in badmodules.keys()
-        if any(pkg in m.lower() for pkg in ["azure", "requests"])
-    ]
+    critical_missing = [m for m in badmodules.keys() if CRITICAL_PATTERN.search(m)]
     if critical_missing:
         print(f"\nWarning: Critical modules missing: {', '.join(critical_missing)}")
         sys.exit(1)
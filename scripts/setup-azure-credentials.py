@@ -47,13 +47,17 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
+import re
+import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # Import shared utilities if available
 try:
@@ -88,6 +92,41 @@ class Colors:
     NC = "\033[0m"  # Reset to default color
 
 
+# Azure errors worth retrying: throttling and transient service failures
+TRANSIENT_ERROR_PATTERN = re.compile(
+    r"429|TooManyRequests|Throttl|ServiceUnavailable|InternalError|InternalServerError"
+)
+
+# Subcommands that are safe to repeat
+RETRYABLE_VERBS = frozenset({"show", "list", "register"})
+
+
+def is_retryable(command: Sequence[str]) -> bool:
+    """Check whether an az command is idempotent and so safe to retry."""
+    subcommand = list(command[1:4])
+    # Role assignment create is also safe: a duplicate assignment is
+    # rejected rather than duplicated
+    return bool(RETRYABLE_VERBS.intersection(subcommand)) or subcommand == [
+        "role",
+        "assignment",
+        "create",
+    ]
+
+
+def _message_prefix(color: str, label: str) -> str:
+    """Build a message prefix, colored only when stdout is a terminal."""
+    if getattr(sys.stdout, "isatty", lambda: False)():
+        return f"{color}[{label}]{Colors.NC} "
+    return f"[{label}] "
+
+
+# Prefixes are built once so redirected output (CI logs, files) has no ANSI codes
+_INFO_PREFIX = _message_prefix(Colors.BLUE, "INFO")
+_SUCCESS_PREFIX = _message_prefix(Colors.GREEN, "SUCCESS")
+_WARNING_PREFIX = _message_prefix(Colors.YELLOW, "WARNING")
+_ERROR_PREFIX = _message_prefix(Colors.RED, "ERROR")
+
+
 # Utility functions for consistent colored output throughout the script
 
 
@@ -101,7 +140,7 @@ def print_status(message: str) -> None:
     Example:
         print_status("Creating service principal...")
     """
-    print(f"{Colors.BLUE}[INFO]{Colors.NC} {message}")
+    sys.stdout.write(f"{_INFO_PREFIX}{message}\n")
 
 
 def print_success(message: str) -> None:
@@ -114,7 +153,7 @@ def print_success(message: str) -> None:
     Example:
         print_success("Service principal created successfully")
     """
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.NC} {message}")
+    sys.stdout.write(f"{_SUCCESS_PREFIX}{message}\n")
 
 
 def print_warning(message: str) -> None:
@@ -127,7 +166,7 @@ def print_warning(message: str) -> None:
     Example:
         print_warning("Storage account already exists, skipping creation")
     """
-    print(f"{Colors.YELLOW}[WARNING]{Colors.NC} {message}")
+    sys.stdout.write(f"{_WARNING_PREFIX}{message}\n")
 
 
 def print_error(message: str) -> None:
@@ -140,10 +179,16 @@ def print_error(message: str) -> None:
     Example:
         print_error("Failed to create service principal")
     """
-    print(f"{Colors.RED}[ERROR]{Colors.NC} {message}")
+    sys.stdout.write(f"{_ERROR_PREFIX}{message}\n")
 
 
-def run_command(command: List[str], check: bool = True) -> subprocess.CompletedProcess:
+def run_command(
+    command: Sequence[str],
+    check: bool = True,
+    capture: bool = True,
+    retries: int = 3,
+    backoff: float = 1.5,
+) -> subprocess.CompletedProcess:
     """
     Execute a shell command and return the result with error handling.
 
@@ -152,44 +197,134 @@ def run_command(command: List[str], check: bool = True) -> subprocess.CompletedP
     output capture.
 
     Args:
-        command: List of command arguments (e.g., ['az', 'account', 'show'])
+        command: Sequence of command arguments (e.g., ['az', 'account', 'show'])
         check: Whether to raise an exception on non-zero exit codes
+        capture: Whether to capture and decode stdout. When False, stdout is
+            discarded and only stderr is kept (as bytes) for error reporting
+        retries: Extra attempts for idempotent commands that fail with a
+            throttling or transient service error
+        backoff: Base of the exponential delay between attempts (max 8s)
 
     Returns:
         CompletedProcess object with stdout, stderr, and return code
 
     Raises:
-        subprocess.CalledProcessError: If check=True and command fails
+        SystemExit: If check=True and command fails
 
     Example:
         result = run_command(['az', 'account', 'show', '--output', 'json'])
         account_info = json.loads(result.stdout)
     """
-    try:
-        result = subprocess.run(command, capture_output=True, text=True, check=check)
-        return result
-    except subprocess.CalledProcessError as e:
+    if capture:
+        output_args = {"capture_output": True, "text": True}
+    else:
+        output_args = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
+
+    # Python creates its own file descriptors non-inheritable (PEP 446), so
+    # on POSIX the child needs no fd-closing pass, and subprocess can take
+    # its faster posix_spawn path
+    output_args["close_fds"] = os.name != "posix"
+
+    attempts = retries + 1 if is_retryable(command) else 1
+    for attempt in range(attempts):
+        result = subprocess.run(command, **output_args)
+        if result.returncode == 0:
+            return result
+
+        stderr = result.stderr
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode(errors="replace")
+        if attempt + 1 < attempts and TRANSIENT_ERROR_PATTERN.search(stderr or ""):
+            time.sleep(min(backoff ** (attempt + 1), 8))
+            continue
+        break
+
+    if check:
         print_error(f"Command failed: {' '.join(command)}")
-        print_error(f"Error: {e.stderr}")
-        if check:
-            sys.exit(1)
-        return e
+        print_error(f"Error: {stderr}")
+        sys.exit(1)
+    return result
+
+
+@functools.lru_cache(maxsize=128)
+def run_cached_query(command: Tuple[str, ...]) -> subprocess.CompletedProcess:
+    """
+    Run a read-only az command once per setup run and reuse its result.
+
+    Only use this for lookups whose answer does not change during the run
+    (e.g. `az account show`, or checking whether a resource already existed
+    before this script started).
+
+    Args:
+        command: Tuple of command arguments, used as the cache key
+
+    Returns:
+        CompletedProcess of the first invocation
+    """
+    return run_command(command, check=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_sdk_clients(subscription_id: str) -> Optional[Tuple[Any, Any]]:
+    """
+    Get Azure SDK management clients, created once per subscription.
+
+    Calling the SDK in-process avoids an Azure CLI cold start for every
+    resource operation. The SDK packages are optional; when they are not
+    installed this returns None and callers fall back to the CLI.
+
+    Args:
+        subscription_id: Subscription the clients operate on
+
+    Returns:
+        Tuple of (ResourceManagementClient, StorageManagementClient) or None
+    """
+    try:
+        from azure.identity import AzureCliCredential
+        from azure.mgmt.resource import ResourceManagementClient
+        from azure.mgmt.storage import StorageManagementClient
+    except ImportError:
+        return None
+
+    # Reuse the az login the rest of this script relies on
+    credential = AzureCliCredential()
+    return (
+        ResourceManagementClient(credential, subscription_id),
+        StorageManagementClient(credential, subscription_id),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_account_info() -> Optional[Dict[str, Any]]:
+    """
+    Get the parsed output of `az account show`, running the CLI only once.
+
+    Returns:
+        Account details, or None if not logged in to Azure
+    """
+    result = run_command(["az", "account", "show", "--output", "json"], check=False)
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout)
+
+
+def normalize_location(location: str) -> str:
+    """Convert a display name such as "East US" to its ARM form "eastus"."""
+    return location.replace(" ", "").lower()
 
 
 def check_prerequisites() -> None:
     """Check if required tools are installed and Azure is properly configured."""
     print_status("Checking prerequisites...")
 
-    required_tools = ["az", "jq"]
+    required_tools = ["az"]
     for tool in required_tools:
-        result = run_command(["which", tool], check=False)
-        if result.returncode != 0:
+        if shutil.which(tool) is None:
             print_error(f"{tool} is not installed. Please install it first.")
             sys.exit(1)
 
     # Check if logged in to Azure
-    result = run_command(["az", "account", "show"], check=False)
-    if result.returncode != 0:
+    if get_account_info() is None:
         print_error("Not logged in to Azure. Please run 'az login' first.")
         sys.exit(1)
 
@@ -199,6 +334,31 @@ def check_prerequisites() -> None:
     print_success("Prerequisites check passed")
 
 
+def get_provider_states() -> Optional[Dict[str, str]]:
+    """
+    Get the registration state of every resource provider in one CLI call.
+
+    Returns:
+        Dictionary mapping provider namespace to registration state, or None
+        if the providers could not be listed
+    """
+    result = run_command(
+        [
+            "az",
+            "provider",
+            "list",
+            "--query",
+            "[].{namespace:namespace, state:registrationState}",
+            "--output",
+            "json",
+        ],
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    return {p["namespace"]: p["state"] for p in json.loads(result.stdout)}
+
+
 def check_and_register_providers() -> None:
     """Check and register required Azure resource providers."""
     print_status("Checking Azure resource providers...")
@@ -217,44 +377,35 @@ def check_and_register_providers() -> None:
     ]
 
     unregistered_providers = []
+    provider_states = get_provider_states() or {}
 
     for provider in required_providers:
-        result = run_command(
-            [
-                "az",
-                "provider",
-                "show",
-                "--namespace",
-                provider,
-                "--query",
-                "registrationState",
-                "--output",
-                "tsv",
-            ],
-            check=False,
-        )
-
-        if result.returncode == 0:
-            state = result.stdout.strip()
-            if state != "Registered":
-                unregistered_providers.append(provider)
-                print_status(f"Provider {provider}: {state}")
-            else:
-                print_status(f"Provider {provider}: Registered")
-        else:
+        state = provider_states.get(provider)
+        if state is None:
             print_warning(f"Could not check provider {provider}")
             unregistered_providers.append(provider)
+        elif state != "Registered":
+            unregistered_providers.append(provider)
+            print_status(f"Provider {provider}: {state}")
+        else:
+            print_status(f"Provider {provider}: Registered")
 
     # Register unregistered providers
     if unregistered_providers:
         print_status(f"Registering {len(unregistered_providers)} resource providers...")
 
-        for provider in unregistered_providers:
-            print_status(f"Registering {provider}...")
-            result = run_command(
-                ["az", "provider", "register", "--namespace", provider], check=False
+        def _register(provider: str) -> subprocess.CompletedProcess:
+            return run_command(
+                ["az", "provider", "register", "--namespace", provider, "--no-wait"],
+                check=False,
+                capture=False,
             )
 
+        # Registrations are independent, so start them all at once
+        with ThreadPoolExecutor(max_workers=len(unregistered_providers)) as executor:
+            results = list(executor.map(_register, unregistered_providers))
+
+        for provider, result in zip(unregistered_providers, results):
             if result.returncode == 0:
                 print_success(f"Registration initiated for {provider}")
             else:
@@ -265,35 +416,23 @@ def check_and_register_providers() -> None:
         print_status("Waiting for provider registration to complete...")
         max_wait_time = 300  # 5 minutes
         start_time = time.time()
+        delay = 2
 
         while time.time() - start_time < max_wait_time:
-            all_registered = True
-            for provider in unregistered_providers:
-                result = run_command(
-                    [
-                        "az",
-                        "provider",
-                        "show",
-                        "--namespace",
-                        provider,
-                        "--query",
-                        "registrationState",
-                        "--output",
-                        "tsv",
-                    ],
-                    check=False,
-                )
-
-                if result.returncode != 0 or result.stdout.strip() != "Registered":
-                    all_registered = False
-                    break
+            provider_states = get_provider_states() or {}
+            all_registered = all(
+                provider_states.get(provider) == "Registered"
+                for provider in unregistered_providers
+            )
 
             if all_registered:
                 print_success("All resource providers registered successfully")
                 break
 
             print_status("Still waiting for provider registration...")
-            time.sleep(10)
+            # Back off so quick registrations are noticed without hammering ARM
+            time.sleep(delay)
+            delay = min(delay * 2, 15)
         else:
             print_warning("Provider registration is taking longer than expected")
             print_status(
@@ -307,8 +446,10 @@ def get_subscription_info() -> Dict[str, str]:
     """Get current Azure subscription information."""
     print_status("Getting Azure subscription information...")
 
-    result = run_command(["az", "account", "show", "--output", "json"])
-    account_info = json.loads(result.stdout)
+    account_info = get_account_info()
+    if account_info is None:
+        print_error("Not logged in to Azure. Please run 'az login' first.")
+        sys.exit(1)
 
     subscription_id = account_info["id"]
     subscription_name = account_info["name"]
@@ -324,14 +465,32 @@ def get_subscription_info() -> Dict[str, str]:
     }
 
 
-def create_state_resource_group(project_name: str, location: str) -> str:
+def create_state_resource_group(
+    project_name: str, location: str, subscription_id: Optional[str] = None
+) -> str:
     """Create resource group for Terraform state."""
     print_status("Creating resource group for Terraform state...")
 
     rg_name = f"{project_name}-terraform-state-rg"
 
+    sdk = get_sdk_clients(subscription_id) if subscription_id else None
+    if sdk:
+        resource_client = sdk[0]
+        if resource_client.resource_groups.check_existence(rg_name):
+            print_warning(f"Resource group {rg_name} already exists")
+        else:
+            resource_client.resource_groups.create_or_update(
+                rg_name,
+                {
+                    "location": normalize_location(location),
+                    "tags": {"Purpose": "TerraformState", "Project": project_name},
+                },
+            )
+            print_success(f"Created resource group: {rg_name}")
+        return rg_name
+
     # Check if resource group exists
-    result = run_command(["az", "group", "show", "--name", rg_name], check=False)
+    result = run_cached_query(("az", "group", "show", "--name", rg_name))
     if result.returncode == 0:
         print_warning(f"Resource group {rg_name} already exists")
     else:
@@ -354,26 +513,104 @@ def create_state_resource_group(project_name: str, location: str) -> str:
     return rg_name
 
 
+def wait_for_storage_account(
+    storage_name: str, rg_name: str, max_wait_time: int = 300
+) -> None:
+    """Poll until a storage account created with --no-wait is provisioned."""
+    start_time = time.time()
+    while time.time() - start_time < max_wait_time:
+        result = run_command(
+            [
+                "az",
+                "storage",
+                "account",
+                "show",
+                "--name",
+                storage_name,
+                "--resource-group",
+                rg_name,
+                "--query",
+                "provisioningState",
+                "--output",
+                "tsv",
+            ],
+            check=False,
+        )
+        state = result.stdout.strip() if result.returncode == 0 else ""
+        if state == "Succeeded":
+            return
+        if state == "Failed":
+            raise RuntimeError(
+                f"Provisioning failed for storage account {storage_name}"
+            )
+        time.sleep(5)
+
+    raise RuntimeError(f"Timed out waiting for storage account {storage_name}")
+
+
+def create_storage_account_sdk(
+    storage_client: Any,
+    storage_name: str,
+    rg_name: str,
+    location: str,
+    env: str,
+    project_name: str,
+) -> None:
+    """Create a storage account and its tfstate container with the SDK."""
+    storage_client.storage_accounts.begin_create(
+        rg_name,
+        storage_name,
+        {
+            "location": normalize_location(location),
+            "kind": "StorageV2",
+            "sku": {"name": "Standard_LRS"},
+            "enable_https_traffic_only": True,
+            "minimum_tls_version": "TLS1_2",
+            "encryption": {
+                "services": {"blob": {"enabled": True}},
+                "key_source": "Microsoft.Storage",
+            },
+            "tags": {
+                "Environment": env,
+                "Purpose": "TerraformState",
+                "Project": project_name,
+            },
+        },
+    ).result()
+    storage_client.blob_containers.create(rg_name, storage_name, "tfstate", {})
+
+
 def create_storage_accounts(
-    project_name: str, rg_name: str, location: str, environments: List[str]
+    project_name: str,
+    rg_name: str,
+    location: str,
+    environments: List[str],
+    subscription_id: Optional[str] = None,
 ) -> Dict[str, str]:
     """Create storage accounts for each environment."""
     print_status("Creating storage accounts for Terraform state...")
 
-    storage_accounts = {}
+    # Ensure storage account name is <= 24 chars (Azure limit)
+    # Format: <short_project>tf<env><timestamp>, with the same short project
+    # name and timestamp shared by every environment
+    short_project = project_name.replace("-", "").replace("_", "")[:8]  # Max 8 chars
     timestamp = str(int(time.time()))[-6:]  # Last 6 digits
+    sdk = get_sdk_clients(subscription_id) if subscription_id else None
 
-    for env in environments:
-        # Ensure storage account name is <= 24 chars (Azure limit)
-        # Format: <short_project>tf<env><timestamp>
-        short_project = project_name.replace("-", "").replace("_", "")[
-            :8
-        ]  # Max 8 chars
+    def _create_one(env: str) -> Tuple[str, str]:
         storage_name = f"{short_project}tf{env}{timestamp}"
 
         print_status(f"Creating storage account for {env} environment...")
 
-        # Create storage account
+        if sdk:
+            create_storage_account_sdk(
+                sdk[1], storage_name, rg_name, location, env, project_name
+            )
+            print_success(f"Created storage account: {storage_name}")
+            return env, storage_name
+
+        # Create storage account without blocking on provisioning, then poll
+        # so the container is not created before the account exists
         run_command(
             [
                 "az",
@@ -398,8 +635,10 @@ def create_storage_accounts(
                 f"Environment={env}",
                 "Purpose=TerraformState",
                 f"Project={project_name}",
+                "--no-wait",
             ]
         )
+        wait_for_storage_account(storage_name, rg_name)
 
         # Create container
         run_command(
@@ -414,26 +653,29 @@ def create_storage_accounts(
                 storage_name,
                 "--auth-mode",
                 "login",
-            ]
+            ],
+            capture=False,
         )
 
-        storage_accounts[env] = storage_name
         print_success(f"Created storage account: {storage_name}")
+        return env, storage_name
 
-    return storage_accounts
+    # Environments are independent, so create them concurrently
+    with ThreadPoolExecutor(max_workers=max(len(environments), 1)) as executor:
+        return dict(executor.map(_create_one, environments))
 
 
 def create_service_principal(
     project_name: str, subscription_id: str, sp_type: str
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     """Create service principal with appropriate permissions."""
     sp_name = f"{project_name}-{sp_type}-sp"
 
     print_status(f"Creating service principal for {sp_type}...")
 
     # Check if service principal exists
-    result = run_command(
-        [
+    result = run_cached_query(
+        (
             "az",
             "ad",
             "sp",
@@ -444,8 +686,7 @@ def create_service_principal(
             "[0].appId",
             "--output",
             "tsv",
-        ],
-        check=False,
+        )
     )
 
     if result.stdout.strip():
@@ -466,13 +707,12 @@ def create_service_principal(
             "Contributor",
             "--scopes",
             f"/subscriptions/{subscription_id}",
-            "--sdk-auth",
         ]
     )
 
     sp_info = json.loads(result.stdout)
-    app_id = sp_info["clientId"]
-    client_secret = sp_info["clientSecret"]
+    app_id = sp_info["appId"]
+    client_secret = sp_info["password"]
 
     print_success(f"Created service principal: {sp_name}")
     print_success(f"Application ID: {app_id}")
@@ -480,72 +720,120 @@ def create_service_principal(
     # Assign additional roles
     print_status("Assigning additional roles...")
 
-    additional_roles = ["User Access Administrator", "Key Vault Administrator"]
-    for role in additional_roles:
+    # Look up the object ID once so each assignment can skip resolving the
+    # application ID through Microsoft Graph
+    object_id = run_cached_query(
+        ("az", "ad", "sp", "show", "--id", app_id, "--query", "id", "--output", "tsv")
+    ).stdout.strip()
+    if object_id:
+        assignee_args = [
+            "--assignee-object-id",
+            object_id,
+            "--assignee-principal-type",
+            "ServicePrincipal",
+        ]
+    else:
+        assignee_args = ["--assignee", app_id]
+
+    def _assign_role(role: str) -> None:
         run_command(
             [
                 "az",
                 "role",
                 "assignment",
                 "create",
-                "--assignee",
-                app_id,
+                *assignee_args,
                 "--role",
                 role,
                 "--scope",
                 f"/subscriptions/{subscription_id}",
             ],
             check=False,
+            capture=False,
         )  # Don't fail if role already assigned
 
+    # Role assignments are independent, so create them concurrently
+    additional_roles = ["User Access Administrator", "Key Vault Administrator"]
+    with ThreadPoolExecutor(max_workers=len(additional_roles)) as executor:
+        list(executor.map(_assign_role, additional_roles))
+
     return {
         "app_id": app_id,
         "client_secret": client_secret,
-        "sp_output": result.stdout,
+        # Credentials in the JSON shape the azure/login GitHub Action expects,
+        # built here rather than requesting the deprecated --sdk-auth output
+        "credentials": {
+            "clientId": app_id,
+            "clientSecret": client_secret,
+            "subscriptionId": subscription_id,
+            "tenantId": sp_info["tenant"],
+        },
     }
 
 
+def write_private_file(path: str, content: str) -> None:
+    """
+    Write a credentials file that only the current user can read.
+
+    The file is created with mode 0600 so there is no window in which the
+    secrets are readable by others. An existing file is restricted as well,
+    since the creation mode does not apply to it.
+
+    Args:
+        path: File to write
+        content: Text to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, "fchmod"):  # Not available on Windows
+        os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+
+
 def generate_env_file(
     project_name: str,
     azure_info: Dict[str, str],
-    terraform_sp: Dict[str, str],
+    terraform_sp: Dict[str, Any],
     storage_accounts: Dict[str, str],
 ) -> None:
     """Generate .env file with all credentials."""
     print_status("Generating .env file...")
 
-    env_content = f"""# Azure credentials for {project_name}
+    parts = [f"""# Azure credentials for {project_name}
 # Generated on {time.strftime('%Y-%m-%d %H:%M:%S')}
 
 # Azure subscription info
 ARM_CLIENT_ID={terraform_sp['app_id']}
 ARM_TENANT_ID={azure_info['tenant_id']}
 ARM_SUBSCRIPTION_ID={azure_info['subscription_id']}
-"""
+"""]
 
     if "client_secret" in terraform_sp:
-        env_content += f"ARM_CLIENT_SECRET={terraform_sp['client_secret']}\n"
+        parts.append(f"ARM_CLIENT_SECRET={terraform_sp['client_secret']}\n")
 
-    env_content += "\n# Storage accounts\n"
-    for env, storage_name in storage_accounts.items():
-        env_content += f"STORAGE_ACCOUNT_NAME_{env.upper()}={storage_name}\n"
+    parts.append("\n# Storage accounts\n")
+    parts.extend(
+        f"STORAGE_ACCOUNT_NAME_{env.upper()}={storage_name}\n"
+        for env, storage_name in storage_accounts.items()
+    )
 
-    with open(".env", "w") as f:
-        f.write(env_content)
+    write_private_file(".env", "".join(parts))
 
     print_success("Generated .env file")
 
 
-def generate_backend_configs(
+def generate_environment_files(
     project_name: str,
+    location: str,
     rg_name: str,
     storage_accounts: Dict[str, str],
     environments: List[str],
 ) -> None:
-    """Generate backend configuration files."""
-    print_status("Generating backend configuration files...")
+    """Generate backend configuration and terraform.tfvars files."""
+    print_status("Generating backend configuration and terraform.tfvars files...")
 
-    for env in environments:
+    def _generate_one(env: str) -> List[Tuple[Any, str]]:
+        messages = []
         env_dir = Path(f"terraform/environments/{env}")
         env_dir.mkdir(parents=True, exist_ok=True)
 
@@ -558,17 +846,10 @@ key                  = "{env}/terraform.tfstate"
         with open(env_dir / "backend.conf", "w") as f:
             f.write(backend_config)
 
-        print_success(f"Generated backend config for {env} environment")
-
-
-def generate_terraform_tfvars(
-    project_name: str, location: str, environments: List[str]
-) -> None:
-    """Generate terraform.tfvars files from examples."""
-    print_status("Generating terraform.tfvars files...")
+        messages.append(
+            (print_success, f"Generated backend config for {env} environment")
+        )
 
-    for env in environments:
-        env_dir = Path(f"terraform/environments/{env}")
         tfvars_file = env_dir / "terraform.tfvars"
         example_file = env_dir / "terraform.tfvars.example"
 
@@ -589,11 +870,32 @@ def generate_terraform_tfvars(
             with open(tfvars_file, "w") as f:
                 f.write(content)
 
-            print_success(f"Generated terraform.tfvars for {env} environment")
+            messages.append(
+                (print_success, f"Generated terraform.tfvars for {env} environment")
+            )
         elif tfvars_file.exists():
-            print_warning(f"terraform.tfvars already exists for {env} environment")
+            messages.append(
+                (
+                    print_warning,
+                    f"terraform.tfvars already exists for {env} environment",
+                )
+            )
         else:
-            print_warning(f"terraform.tfvars.example not found for {env} environment")
+            messages.append(
+                (
+                    print_warning,
+                    f"terraform.tfvars.example not found for {env} environment",
+                )
+            )
+
+        return messages
+
+    # Each environment writes to its own directory, so generate them in
+    # parallel and report the results in order afterwards
+    with ThreadPoolExecutor(max_workers=min(8, max(len(environments), 1))) as executor:
+        for messages in executor.map(_generate_one, environments):
+            for printer, message in messages:
+                printer(message)
 
 
 def main():
@@ -663,27 +965,48 @@ def main():
     try:
         check_prerequisites()
         azure_info = get_subscription_info()
-        rg_name = create_state_resource_group(args.project_name, args.location)
-        storage_accounts = create_storage_accounts(
-            args.project_name, rg_name, args.location, args.environments
+        rg_name = create_state_resource_group(
+            args.project_name, args.location, azure_info["subscription_id"]
         )
-        terraform_sp = create_service_principal(
-            args.project_name, azure_info["subscription_id"], "terraform"
-        )
-        github_sp = create_service_principal(
-            args.project_name, azure_info["subscription_id"], "github-actions"
+        storage_accounts = create_storage_accounts(
+            args.project_name,
+            rg_name,
+            args.location,
+            args.environments,
+            azure_info["subscription_id"],
         )
+        # The two service principals share no state, so create them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            terraform_future = executor.submit(
+                create_service_principal,
+                args.project_name,
+                azure_info["subscription_id"],
+                "terraform",
+            )
+            github_future = executor.submit(
+                create_service_principal,
+                args.project_name,
+                azure_info["subscription_id"],
+                "github-actions",
+            )
+            terraform_sp = terraform_future.result()
+            github_sp = github_future.result()
 
         generate_env_file(args.project_name, azure_info, terraform_sp, storage_accounts)
-        generate_backend_configs(
-            args.project_name, rg_name, storage_accounts, args.environments
+        generate_environment_files(
+            args.project_name,
+            args.location,
+            rg_name,
+            storage_accounts,
+            args.environments,
         )
-        generate_terraform_tfvars(args.project_name, args.location, args.environments)
 
         # Save GitHub Actions credentials
-        if "sp_output" in github_sp:
-            with open("github-actions-credentials.json", "w") as f:
-                f.write(github_sp["sp_output"])
+        if "credentials" in github_sp:
+            write_private_file(
+                "github-actions-credentials.json",
+                json.dumps(github_sp["credentials"], indent=2) + "\n",
+            )
             print_success(
                 "GitHub Actions credentials saved to github-actions-credentials.json"
             )
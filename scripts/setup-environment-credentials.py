@@ -30,11 +30,14 @@ Usage:
 import argparse
 import json
 import os
+import shutil
 import subprocess
 import sys
-import time
-from pathlib import Path
-from typing import Dict, List, Optional
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Dict, List, Optional
 
 # Import shared utilities if available
 try:
@@ -44,6 +47,7 @@ try:
         print_status,
         print_success,
         print_warning,
+        read_azure_profile,
     )
 
     AZURE_UTILS_AVAILABLE = True
@@ -63,6 +67,35 @@ except ImportError:
     def print_error(msg):
         print(f"[ERROR] {msg}")
 
+    def read_azure_profile():
+        # Callers then ask the Azure CLI instead
+        return None
+
+
+# Environment for CLI calls: no telemetry upload and no colorized output
+AZ_ENVIRONMENT = {
+    **os.environ,
+    "AZURE_CORE_COLLECT_TELEMETRY": "no",
+    "AZURE_CORE_NO_COLOR": "true",
+}
+
+# Same, with warnings suppressed (equivalent to --only-show-errors)
+AZ_QUIET_ENVIRONMENT = {**AZ_ENVIRONMENT, "AZURE_CORE_ONLY_SHOW_ERRORS": "true"}
+
+# Base roles for all environments
+BASE_ROLES = ("User Access Administrator", "Key Vault Administrator")
+
+# Environment-specific roles
+ENVIRONMENT_ROLES = {
+    "dev": ("Storage Account Contributor",),
+    "staging": ("Storage Account Contributor", "Network Contributor"),
+    "prod": (
+        "Storage Account Contributor",
+        "Network Contributor",
+        "Security Admin",
+    ),
+}
+
 
 class EnvironmentCredentialsSetup:
     """Main class for environment-specific credentials setup."""
@@ -70,13 +103,42 @@ class EnvironmentCredentialsSetup:
     def __init__(self, project_name: str = "aks-platform"):
         self.project_name = project_name
         self.environments = {}
+        # Shared by every environment that uses the current subscription
+        self._subscription_info: Optional[Dict[str, str]] = None
+        # Environments may be set up from several threads at once
+        self._lock = threading.Lock()
+        self._authorization_clients: Dict[str, Optional[Any]] = {}
 
     def run_command(
-        self, cmd: List[str], check: bool = True
+        self,
+        cmd: List[str],
+        check: bool = True,
+        input: Optional[str] = None,
+        capture: bool = True,
+        stdin: Optional[IO] = None,
+        show_warnings: bool = False,
     ) -> subprocess.CompletedProcess:
-        """Run a command and return the result."""
+        """
+        Run a command, optionally feeding it input, and return the result.
+
+        Input is either a string (input) or an open file the child reads
+        directly (stdin). Pass capture=False when only the exit status
+        matters; stdout is then discarded instead of being read into memory
+        (stderr is still kept). Azure CLI warnings are suppressed unless
+        show_warnings is set.
+        """
+        stdout = subprocess.PIPE if capture else subprocess.DEVNULL
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=check)
+            result = subprocess.run(
+                cmd,
+                stdout=stdout,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=check,
+                input=input,
+                stdin=stdin,
+                env=AZ_ENVIRONMENT if show_warnings else AZ_QUIET_ENVIRONMENT,
+            )
             return result
         except subprocess.CalledProcessError as e:
             if check:
@@ -85,15 +147,62 @@ class EnvironmentCredentialsSetup:
                 sys.exit(1)
             return e
 
+    def get_authorization_client(self, subscription_id: str) -> Optional[Any]:
+        """
+        Get an Azure SDK authorization client, created once per subscription.
+
+        Role assignments made through the SDK share one token and connection
+        pool instead of starting the Azure CLI for each role. The SDK packages
+        are optional; when they are not installed this returns None and roles
+        are assigned with the CLI.
+        """
+        with self._lock:
+            if subscription_id not in self._authorization_clients:
+                try:
+                    from azure.identity import AzureCliCredential
+                    from azure.mgmt.authorization import AuthorizationManagementClient
+                except ImportError:
+                    client = None
+                else:
+                    # Reuse the az login the rest of this script relies on
+                    client = AuthorizationManagementClient(
+                        AzureCliCredential(), subscription_id
+                    )
+                self._authorization_clients[subscription_id] = client
+            return self._authorization_clients[subscription_id]
+
     def get_subscription_info(self) -> Dict[str, str]:
-        """Get current Azure subscription information."""
-        result = self.run_command(["az", "account", "show", "--output", "json"])
-        account_info = json.loads(result.stdout)
-        return {
-            "subscription_id": account_info["id"],
-            "subscription_name": account_info["name"],
-            "tenant_id": account_info["tenantId"],
-        }
+        """Get current Azure subscription information, querying Azure once."""
+        with self._lock:
+            if self._subscription_info is None:
+                account_info = read_azure_profile()
+                if account_info is None:
+                    # Project just the three fields needed instead of parsing
+                    # the full account document
+                    result = self.run_command(
+                        [
+                            "az",
+                            "account",
+                            "show",
+                            "--query",
+                            "[id, name, tenantId]",
+                            "--output",
+                            "tsv",
+                        ]
+                    )
+                    account_info = dict(
+                        zip(
+                            ("id", "name", "tenantId"),
+                            # Accept the fields one per line or tab-separated
+                            result.stdout.replace("\t", "\n").splitlines(),
+                        )
+                    )
+                self._subscription_info = {
+                    "subscription_id": account_info["id"],
+                    "subscription_name": account_info["name"],
+                    "tenant_id": account_info["tenantId"],
+                }
+        return self._subscription_info
 
     def create_environment_service_principal(
         self, environment: str, subscription_id: str
@@ -105,34 +214,10 @@ class EnvironmentCredentialsSetup:
             f"Creating service principal for {environment} environment: {sp_name}"
         )
 
-        # Check if service principal exists
-        result = self.run_command(
-            [
-                "az",
-                "ad",
-                "sp",
-                "list",
-                "--display-name",
-                sp_name,
-                "--query",
-                "[0].appId",
-                "--output",
-                "tsv",
-            ],
-            check=False,
-        )
-
-        if result.stdout.strip():
-            print_warning(f"Service principal {sp_name} already exists")
-            app_id = result.stdout.strip()
-
-            # Get existing credentials (this will require manual intervention)
-            print_warning(
-                f"Using existing service principal. You may need to reset credentials."
-            )
-            return {"app_id": app_id, "existing": True}
-
-        # Create service principal with environment-specific scope
+        # Create service principal with environment-specific scope. There is
+        # no existence pre-check: create-for-rbac patches an existing
+        # application of the same name and issues it fresh credentials, so one
+        # call both creates and refreshes.
         scope = f"/subscriptions/{subscription_id}"
 
         result = self.run_command(
@@ -148,11 +233,18 @@ class EnvironmentCredentialsSetup:
                 "--scopes",
                 scope,
                 "--sdk-auth",
-            ]
+            ],
+            # Keep the "existing application" warning checked below
+            show_warnings=True,
         )
 
         sp_info = json.loads(result.stdout)
 
+        if "existing application" in result.stderr:
+            print_warning(
+                f"Service principal {sp_name} already existed; its credentials "
+                "were reset"
+            )
         print_success(f"Created service principal: {sp_name}")
         print_success(f"Application ID: {sp_info['clientId']}")
 
@@ -167,23 +259,58 @@ class EnvironmentCredentialsSetup:
         """Assign environment-appropriate roles to service principal."""
         print_status(f"Assigning roles for {environment} environment...")
 
-        # Base roles for all environments
-        base_roles = ["User Access Administrator", "Key Vault Administrator"]
-
-        # Environment-specific roles
-        env_roles = {
-            "dev": ["Storage Account Contributor"],
-            "staging": ["Storage Account Contributor", "Network Contributor"],
-            "prod": [
-                "Storage Account Contributor",
-                "Network Contributor",
-                "Security Admin",
-            ],
-        }
+        all_roles = BASE_ROLES + ENVIRONMENT_ROLES.get(environment, ())
+        scope = f"/subscriptions/{subscription_id}"
 
-        all_roles = base_roles + env_roles.get(environment, [])
+        client = self.get_authorization_client(subscription_id)
+        object_id = None
+        if client:
+            # Role assignments take the principal's object ID, not its app ID
+            result = self.run_command(
+                [
+                    "az",
+                    "ad",
+                    "sp",
+                    "show",
+                    "--id",
+                    app_id,
+                    "--query",
+                    "id",
+                    "--output",
+                    "tsv",
+                ],
+                check=False,
+            )
+            object_id = result.stdout.strip() or None
+
+        def _assign(role: str) -> Optional[str]:
+            """Assign one role, returning None on success or the error text."""
+            if object_id:
+                try:
+                    role_definition = next(
+                        iter(
+                            client.role_definitions.list(
+                                scope, filter=f"roleName eq '{role}'"
+                            )
+                        )
+                    )
+                    client.role_assignments.create(
+                        scope,
+                        str(uuid.uuid4()),
+                        {
+                            "role_definition_id": role_definition.id,
+                            "principal_id": object_id,
+                            "principal_type": "ServicePrincipal",
+                        },
+                    )
+                    return None
+                except Exception as e:
+                    # 409 Conflict: the principal already has this role
+                    if getattr(e, "status_code", None) == 409:
+                        return None
+                    # Anything else (credential errors, a role definition
+                    # the SDK could not find) gets a second try via the CLI
 
-        for role in all_roles:
             result = self.run_command(
                 [
                     "az",
@@ -195,15 +322,24 @@ class EnvironmentCredentialsSetup:
                     "--role",
                     role,
                     "--scope",
-                    f"/subscriptions/{subscription_id}",
+                    scope,
                 ],
                 check=False,
+                capture=False,
             )
-
             if result.returncode == 0:
+                return None
+            return result.stderr.strip() or f"exit status {result.returncode}"
+
+        # Role assignments are independent, so create them concurrently
+        with ThreadPoolExecutor(max_workers=len(all_roles)) as executor:
+            errors = list(executor.map(_assign, all_roles))
+
+        for role, error in zip(all_roles, errors):
+            if error is None:
                 print_success(f"Assigned role: {role}")
             else:
-                print_warning(f"Failed to assign role {role} (may already exist)")
+                print_warning(f"Failed to assign role {role}: {error}")
 
     def setup_environment_credentials(
         self, environment: str, subscription_id: str = None
@@ -222,15 +358,20 @@ class EnvironmentCredentialsSetup:
         )
 
         # Store environment configuration
-        self.environments[environment] = {
-            "subscription_id": subscription_id,
-            "service_principal": sp_info,
-            "credentials_file": f"github-actions-credentials-{environment}.json",
-        }
+        with self._lock:
+            self.environments[environment] = {
+                "subscription_id": subscription_id,
+                "service_principal": sp_info,
+                "credentials": {
+                    "client_id": sp_info["clientId"],
+                    "client_secret": sp_info["clientSecret"],
+                    "tenant_id": sp_info["tenantId"],
+                },
+                "credentials_file": f"github-actions-credentials-{environment}.json",
+            }
 
         # Generate environment-specific credentials file
-        if not sp_info.get("existing"):
-            self.generate_environment_credentials_file(environment, sp_info)
+        self.generate_environment_credentials_file(environment, sp_info)
 
         return sp_info
 
@@ -242,8 +383,17 @@ class EnvironmentCredentialsSetup:
 
         print_status(f"Generating credentials file: {credentials_file}")
 
-        with open(credentials_file, "w") as f:
-            json.dump(sp_info, f, indent=2)
+        # Write a private (0600, as mkstemp creates it) temporary file and
+        # rename it into place, so the secrets are never world-readable and an
+        # interrupted run cannot leave a truncated file behind
+        fd, tmp_path = tempfile.mkstemp(dir=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(sp_info, f, indent=2)
+            os.replace(tmp_path, credentials_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
         print_success(f"Generated {credentials_file}")
         print_warning(
@@ -257,56 +407,50 @@ class EnvironmentCredentialsSetup:
             return
 
         env_config = self.environments[environment]
-        sp_info = env_config["service_principal"]
 
         print_status(f"Setting up GitHub secrets for {environment} environment...")
 
         # Check if GitHub CLI is available
-        result = self.run_command(["which", "gh"], check=False)
-        if result.returncode != 0:
+        if shutil.which("gh") is None:
             print_warning("GitHub CLI not found. Skipping GitHub setup.")
             return
 
         # Set environment-specific secrets
+        credentials = env_config["credentials"]
         secrets = {
-            "ARM_CLIENT_ID": sp_info.get("clientId", sp_info.get("app_id")),
-            "ARM_CLIENT_SECRET": sp_info.get("clientSecret", ""),
+            "ARM_CLIENT_ID": credentials["client_id"],
+            "ARM_CLIENT_SECRET": credentials["client_secret"],
             "ARM_SUBSCRIPTION_ID": env_config["subscription_id"],
-            "ARM_TENANT_ID": sp_info.get("tenantId", ""),
+            "ARM_TENANT_ID": credentials["tenant_id"],
         }
 
-        for secret_name, secret_value in secrets.items():
-            if secret_value:
-                result = self.run_command(
-                    [
-                        "gh",
-                        "secret",
-                        "set",
-                        secret_name,
-                        "--env",
-                        environment,
-                        "--body",
-                        secret_value,
-                    ],
-                    check=False,
-                )
-
-                if result.returncode == 0:
-                    print_success(f"Set {secret_name} for {environment}")
-                else:
-                    print_warning(f"Failed to set {secret_name} for {environment}")
+        secrets = {name: value for name, value in secrets.items() if value}
+
+        # Set every secret with one gh call, passing a dotenv document on stdin
+        # so the values never touch disk or the process list. Values are
+        # single-quoted so gh takes them literally.
+        result = self.run_command(
+            ["gh", "secret", "set", "--env", environment, "--env-file", "-"],
+            input="".join(f"{name}='{value}'\n" for name, value in secrets.items()),
+            check=False,
+        )
 
-        # Set AZURE_CREDENTIALS from file if it exists
-        credentials_file = env_config["credentials_file"]
-        if os.path.exists(credentials_file):
+        if result.returncode == 0:
+            print_success(f"Set {', '.join(secrets)} for {environment}")
+        else:
+            print_warning(f"Failed to set {', '.join(secrets)} for {environment}")
+
+        # Set AZURE_CREDENTIALS from the file written during setup, handing
+        # it to gh as stdin rather than reading it here
+        with open(env_config["credentials_file"], "rb") as f:
             result = self.run_command(
                 ["gh", "secret", "set", "AZURE_CREDENTIALS", "--env", environment],
-                input=open(credentials_file).read(),
+                stdin=f,
                 check=False,
             )
 
-            if result.returncode == 0:
-                print_success(f"Set AZURE_CREDENTIALS for {environment}")
+        if result.returncode == 0:
+            print_success(f"Set AZURE_CREDENTIALS for {environment}")
 
         # Set environment variables
         variables = {
@@ -315,25 +459,19 @@ class EnvironmentCredentialsSetup:
             "PROJECT_NAME": self.project_name,
         }
 
-        for var_name, var_value in variables.items():
-            result = self.run_command(
-                [
-                    "gh",
-                    "variable",
-                    "set",
-                    var_name,
-                    "--env",
-                    environment,
-                    "--body",
-                    var_value,
-                ],
-                check=False,
-            )
+        # Set every variable with one gh call, as for the secrets above
+        result = self.run_command(
+            ["gh", "variable", "set", "--env", environment, "--env-file", "-"],
+            input="".join(f"{name}='{value}'\n" for name, value in variables.items()),
+            check=False,
+        )
 
-            if result.returncode == 0:
-                print_success(f"Set variable {var_name} for {environment}")
-            else:
-                print_warning(f"Failed to set variable {var_name} for {environment}")
+        if result.returncode == 0:
+            print_success(f"Set variables {', '.join(variables)} for {environment}")
+        else:
+            print_warning(
+                f"Failed to set variables {', '.join(variables)} for {environment}"
+            )
 
 
 def main():
@@ -379,7 +517,7 @@ def main():
     try:
         setup = EnvironmentCredentialsSetup(args.project_name)
 
-        for env in environments:
+        def process_env(env: str) -> None:
             print_status(f"Processing {env} environment...")
             setup.setup_environment_credentials(env)
 
@@ -387,7 +525,11 @@ def main():
                 setup.setup_github_environment_secrets(env)
 
             print_success(f"Completed setup for {env} environment")
-            print()
+
+        # Environments are independent, so set them up concurrently
+        with ThreadPoolExecutor(max_workers=len(environments)) as executor:
+            list(executor.map(process_env, environments))
+        print()
 
         print_success("Environment-specific credentials setup completed!")
 
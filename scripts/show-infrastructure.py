@@ -19,13 +19,39 @@ Usage:
     ./scripts/show-infrastructure.py --all-environments --include-costs
 """
 
-import argparse
+import functools
 import json
+import math
+import os
 import subprocess
 import sys
-from datetime import datetime, timedelta
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+# requests lets listings go straight to ARM instead of through the Azure CLI
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# orjson parses the large az and terraform JSON payloads several times faster
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
 
 # Import shared utilities
 try:
@@ -37,6 +63,7 @@ try:
         print_status,
         print_success,
         print_warning,
+        read_azure_profile,
     )
 
     AZURE_UTILS_AVAILABLE = True
@@ -56,13 +83,186 @@ except ImportError:
     def print_error(msg):
         print(f"[ERROR] {msg}")
 
+    def read_azure_profile():
+        # Callers then ask the Azure CLI instead
+        return None
+
+
+# How long lookups shared between sections of the overview are reused
+CACHE_TTL_SECONDS = 300
+
+# Lookups are also kept here so repeated runs within CACHE_TTL_SECONDS
+# reuse them; --refresh ignores what is stored
+OVERVIEW_CACHE_FILE = (
+    Path.home() / ".cache" / "azure-platform" / "show-infrastructure.json"
+)
+
+# Period covered by --include-costs
+COST_PERIOD_DAYS = 30
+
+ARM_ENDPOINT = "https://management.azure.com"
+
+
+def create_arm_session() -> "requests.Session":
+    """
+    Create the HTTP session shared by every ARM call.
+
+    Concurrent lookups reuse pooled connections to management.azure.com
+    instead of each paying for a new TLS handshake, and throttled (429) or
+    transient 5xx responses are retried with backoff.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry),
+    )
+    return session
+
+
+def overview_workers(environment_count: int) -> int:
+    """Size the lookup thread pool so every environment's lookups run at once."""
+    return min(32, 8 + 4 * environment_count)
+
+
+def write_json_report(report: Dict[str, Any], stream: IO[str], pretty: bool = False):
+    """
+    Write a report as JSON, compact unless pretty output is requested.
+
+    Args:
+        report: Report data from InfrastructureOverview.collect_report
+        stream: Text stream to write to
+        pretty: Indent the output for reading
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        stream.flush()
+        stream.buffer.write(orjson.dumps(report, option=option))
+        stream.buffer.flush()
+    else:
+        separators = None if pretty else (",", ":")
+        indent = 2 if pretty else None
+        stream.write(json.dumps(report, indent=indent, separators=separators) + "\n")
+
+
+def cached_lookup(method):
+    """
+    Cache a getter's result on the instance for CACHE_TTL_SECONDS.
+
+    The overview and every environment section read the same project-wide
+    lists, so each is fetched from Azure once and filtered in memory. Calls
+    for different getters still run concurrently; concurrent calls for the
+    same getter wait for the first one instead of querying Azure again.
+    Getters that take arguments, such as an environment name, are cached
+    separately for each set of arguments. Results are also looked up in and
+    added to the on-disk cache shared with recent runs.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        key = (method.__name__,) + args
+        with self._cache_lock:
+            lock = self._cache_locks.setdefault(key, threading.Lock())
+        with lock:
+            entry = self._cache.get(key)
+            if entry is None or time.monotonic() - entry[0] > CACHE_TTL_SECONDS:
+                entry = self.load_persisted_lookup(key)
+                if entry is None:
+                    entry = (time.monotonic(), method(self, *args))
+                    self.persist_lookup(key, entry[1])
+                self._cache[key] = entry
+        return entry[1]
+
+    return wrapper
+
 
 class InfrastructureOverview:
     """Main class for infrastructure overview functionality."""
 
-    def __init__(self, project_name: str = "aks-platform"):
+    def __init__(self, project_name: str = "aks-platform", refresh: bool = False):
         self.project_name = project_name
         self.azure_helper = AzureHelper() if AZURE_UTILS_AVAILABLE else None
+        self._cache: Dict[Tuple, Any] = {}
+        self._cache_locks: Dict[Tuple, threading.Lock] = {}
+        self._cache_lock = threading.Lock()
+        self._out: List[str] = []
+        self._terraform_lock = threading.Lock()
+        # Stored lookups are only valid for the same project, account and
+        # repository checkout
+        account = read_azure_profile() or {}
+        self._persist_scope = "|".join(
+            [project_name, account.get("id", ""), os.getcwd()]
+        )
+        self._persisted = {} if refresh else self.read_overview_cache()
+        self._arm_token: Optional[Dict[str, Any]] = None
+        self._arm_lock = threading.Lock()
+        self._arm_session = create_arm_session() if REQUESTS_AVAILABLE else None
+
+    @staticmethod
+    def read_overview_cache() -> Dict[str, Any]:
+        """Read the lookups stored by recent runs, or an empty dict."""
+        try:
+            with open(OVERVIEW_CACHE_FILE, "rb") as f:
+                entries = json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def load_persisted_lookup(self, key: Tuple) -> Optional[Tuple[float, Any]]:
+        """
+        Get a lookup stored by a recent run, if it is still fresh.
+
+        Returns:
+            A (monotonic time, value) cache entry, or None
+        """
+        stored = self._persisted.get("|".join((self._persist_scope,) + key))
+        if stored is None:
+            return None
+        age = time.time() - stored.get("time", 0)
+        if not 0 <= age <= CACHE_TTL_SECONDS:
+            return None
+        return time.monotonic() - age, stored["value"]
+
+    def persist_lookup(self, key: Tuple, value: Any):
+        """
+        Remember a lookup for save_overview_cache.
+
+        Empty results and error reports are not stored, so a lookup that
+        failed is retried on the next run instead of being reused.
+        """
+        if value and not (isinstance(value, dict) and "error" in value):
+            with self._cache_lock:
+                self._persisted["|".join((self._persist_scope,) + key)] = {
+                    "time": time.time(),
+                    "value": value,
+                }
+
+    def save_overview_cache(self):
+        """Write the fresh lookups for the next run, dropping expired ones."""
+        now = time.time()
+        with self._cache_lock:
+            entries = {
+                key: stored
+                for key, stored in self._persisted.items()
+                if now - stored.get("time", 0) <= CACHE_TTL_SECONDS
+            }
+
+        # The cache is only an optimization, so write failures are ignored
+        try:
+            OVERVIEW_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = OVERVIEW_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, OVERVIEW_CACHE_FILE)
+        except (OSError, TypeError, ValueError):
+            pass
 
     def run_command(
         self, cmd: List[str], check: bool = True
@@ -78,11 +278,146 @@ class InfrastructureOverview:
                 raise
             return e
 
+    def run_json_command(self, cmd: List[str]) -> Any:
+        """
+        Run a command and parse its JSON output.
+
+        The output is parsed as bytes instead of being decoded into a string
+        first, so large listings are not held in memory twice. stderr goes to
+        a temporary file so a chatty command cannot block on a full pipe while
+        its output is being read.
+        """
+        with tempfile.TemporaryFile() as stderr:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr) as proc:
+                output = proc.stdout.read()
+                returncode = proc.wait()
+
+            if returncode != 0:
+                stderr.seek(0)
+                error = stderr.read().decode(errors="replace")
+                print_error(f"Command failed: {' '.join(cmd)}")
+                print_error(f"Error: {error}")
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=error)
+            return json_loads(output)
+
+    def get_arm_credentials(self) -> Tuple[str, str]:
+        """
+        Get an ARM access token and its subscription ID.
+
+        The token comes from the Azure CLI login once and is reused until
+        shortly before it expires.
+
+        Returns:
+            Tuple of (access token, subscription ID)
+        """
+        with self._arm_lock:
+            if self._arm_token is None or time.time() > self._arm_token["expires_on"]:
+                result = self.run_command(
+                    [
+                        "az",
+                        "account",
+                        "get-access-token",
+                        "--resource",
+                        ARM_ENDPOINT,
+                        "--output",
+                        "json",
+                    ]
+                )
+                token = json_loads(result.stdout)
+                # Older CLI versions only report a local expiresOn timestamp,
+                # so assume a short lifetime there
+                expires_on = int(token.get("expires_on", time.time() + 300))
+                self._arm_token = {
+                    "access_token": token["accessToken"],
+                    "subscription_id": token["subscription"],
+                    "expires_on": expires_on - 60,
+                }
+            return self._arm_token["access_token"], self._arm_token["subscription_id"]
+
+    def arm_list(
+        self, path: str, api_version: str, odata_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List a subscription-level ARM collection, following nextLink pages.
+
+        Args:
+            path: Collection path below /subscriptions/{id}/
+            api_version: ARM API version for the collection
+            odata_filter: Optional $filter expression applied by ARM
+
+        Returns:
+            All items in the collection
+        """
+        access_token, subscription_id = self.get_arm_credentials()
+        url = f"{ARM_ENDPOINT}/subscriptions/{subscription_id}/{path}"
+        params: Optional[Dict[str, str]] = {"api-version": api_version}
+        if odata_filter:
+            params["$filter"] = odata_filter
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        items: List[Dict[str, Any]] = []
+        while url:
+            response = self._arm_session.get(
+                url, params=params, headers=headers, timeout=60
+            )
+            response.raise_for_status()
+            page = json_loads(response.content)
+            items.extend(page.get("value", []))
+            # nextLink already carries the api-version and paging token
+            url = page.get("nextLink")
+            params = None
+        return items
+
+    def resource_graph_query(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Run an Azure Resource Graph query over the current subscription.
+
+        Args:
+            query: KQL query text
+
+        Returns:
+            All result rows, following $skipToken pages
+        """
+        access_token, subscription_id = self.get_arm_credentials()
+        body: Dict[str, Any] = {
+            "subscriptions": [subscription_id],
+            "query": query,
+            "options": {"resultFormat": "objectArray"},
+        }
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        rows: List[Dict[str, Any]] = []
+        while True:
+            response = self._arm_session.post(
+                f"{ARM_ENDPOINT}/providers/Microsoft.ResourceGraph/resources",
+                params={"api-version": "2021-03-01"},
+                headers=headers,
+                json=body,
+                timeout=60,
+            )
+            response.raise_for_status()
+            page = json_loads(response.content)
+            rows.extend(page.get("data", []))
+            skip_token = page.get("$skipToken")
+            if not skip_token:
+                return rows
+            body["options"]["$skipToken"] = skip_token
+
+    @staticmethod
+    def flatten_properties(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Lift an ARM resource's properties to the top level, as az does."""
+        flattened = dict(item.get("properties") or {})
+        flattened.update((k, v) for k, v in item.items() if k != "properties")
+        return flattened
+
+    @cached_lookup
     def get_subscription_info(self) -> Dict[str, str]:
         """Get Azure subscription information."""
         try:
-            result = self.run_command(["az", "account", "show", "--output", "json"])
-            account_info = json.loads(result.stdout)
+            account_info = read_azure_profile()
+            if account_info is None:
+                result = self.run_command(["az", "account", "show", "--output", "json"])
+                account_info = json_loads(result.stdout)
             return {
                 "subscription_id": account_info["id"],
                 "subscription_name": account_info["name"],
@@ -92,10 +427,81 @@ class InfrastructureOverview:
             print_warning(f"Could not get subscription info: {e}")
             return {}
 
+    @cached_lookup
+    def get_project_inventory(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Get the project's resource groups and resources with one query.
+
+        A single Resource Graph query replaces the separate resource group,
+        resource, AKS and storage account listings. The getters for those
+        fall back to listing individually when this returns None.
+
+        Returns:
+            Dictionary with resource_groups, resources, aks_clusters and
+            storage_accounts lists, or None if Resource Graph is unavailable
+        """
+        if not REQUESTS_AVAILABLE:
+            return None
+
+        project = self.project_name
+        short_name = project.replace("-", "")
+        columns = "id, name, type, resourceGroup, location, sku, tags, properties"
+        query = (
+            f"Resources | where resourceGroup contains '{project}'"
+            " or (type =~ 'microsoft.containerservice/managedclusters'"
+            f" and name contains_cs '{project}')"
+            " or (type =~ 'microsoft.storage/storageaccounts'"
+            f" and name contains_cs '{short_name}')"
+            f" | project {columns}"
+            " | union (ResourceContainers"
+            " | where type =~ 'microsoft.resources/subscriptions/resourcegroups'"
+            f" and name contains_cs '{project}' | project {columns})"
+        )
+        try:
+            rows = self.resource_graph_query(query)
+        except Exception:
+            return None
+
+        inventory: Dict[str, List[Dict[str, Any]]] = {
+            "resource_groups": [],
+            "resources": [],
+            "aks_clusters": [],
+            "storage_accounts": [],
+        }
+        for row in rows:
+            # Resource Graph reports resource types in lower case
+            row_type = row.get("type", "").lower()
+            name = row.get("name", "")
+            if row_type == "microsoft.resources/subscriptions/resourcegroups":
+                inventory["resource_groups"].append(row)
+                continue
+            if project.lower() in row.get("resourceGroup", "").lower():
+                inventory["resources"].append(row)
+            if (
+                row_type == "microsoft.containerservice/managedclusters"
+                and project in name
+            ):
+                inventory["aks_clusters"].append(self.flatten_properties(row))
+            elif row_type == "microsoft.storage/storageaccounts" and short_name in name:
+                inventory["storage_accounts"].append(self.flatten_properties(row))
+        return inventory
+
+    @cached_lookup
     def get_resource_groups(self) -> List[Dict[str, Any]]:
         """Get all resource groups related to the project."""
         try:
-            result = self.run_command(
+            inventory = self.get_project_inventory()
+            if inventory is not None:
+                return inventory["resource_groups"]
+
+            if REQUESTS_AVAILABLE:
+                return [
+                    rg
+                    for rg in self.arm_list("resourcegroups", "2021-04-01")
+                    if self.project_name in rg["name"]
+                ]
+
+            return self.run_json_command(
                 [
                     "az",
                     "group",
@@ -106,7 +512,6 @@ class InfrastructureOverview:
                     "json",
                 ]
             )
-            return json.loads(result.stdout)
         except Exception as e:
             print_warning(f"Could not get resource groups: {e}")
             return []
@@ -114,7 +519,7 @@ class InfrastructureOverview:
     def get_resources_in_group(self, resource_group: str) -> List[Dict[str, Any]]:
         """Get all resources in a specific resource group."""
         try:
-            result = self.run_command(
+            return self.run_json_command(
                 [
                     "az",
                     "resource",
@@ -125,34 +530,120 @@ class InfrastructureOverview:
                     "json",
                 ]
             )
-            return json.loads(result.stdout)
         except Exception as e:
             print_warning(f"Could not get resources for {resource_group}: {e}")
             return []
 
+    @cached_lookup
+    def get_project_resources(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the resources in every project resource group with one call.
+
+        Returns:
+            Dictionary mapping lower-cased resource group name to its
+            resources (ARM does not preserve resource group name case here)
+        """
+        try:
+            inventory = self.get_project_inventory()
+            if inventory is not None:
+                resources = inventory["resources"]
+            elif REQUESTS_AVAILABLE:
+                # Only project resource groups come back over the wire
+                resources = self.arm_list(
+                    "resources",
+                    "2021-04-01",
+                    f"substringof('{self.project_name}', resourceGroup)",
+                )
+                for resource in resources:
+                    # ARM omits the group az adds; it is the 5th id segment
+                    resource["resourceGroup"] = resource["id"].split("/")[4]
+            else:
+                resources = self.run_json_command(
+                    ["az", "resource", "list", "--output", "json"]
+                )
+        except Exception as e:
+            print_warning(f"Could not get resources: {e}")
+            return {}
+
+        project = self.project_name.lower()
+        resources_by_group: Dict[str, List[Dict[str, Any]]] = {}
+        for resource in resources:
+            group = resource.get("resourceGroup", "").lower()
+            if project in group:
+                resources_by_group.setdefault(group, []).append(resource)
+        return resources_by_group
+
+    @cached_lookup
     def get_aks_clusters(self) -> List[Dict[str, Any]]:
         """Get all AKS clusters related to the project."""
         try:
-            result = self.run_command(
+            inventory = self.get_project_inventory()
+            if inventory is not None:
+                return inventory["aks_clusters"]
+
+            if REQUESTS_AVAILABLE:
+                return [
+                    self.flatten_properties(cluster)
+                    for cluster in self.arm_list(
+                        "providers/Microsoft.ContainerService/managedClusters",
+                        "2023-08-01",
+                    )
+                    if self.project_name in cluster["name"]
+                ]
+
+            return self.run_json_command(
                 [
                     "az",
                     "aks",
                     "list",
+                    # Only the fields the report shows; full cluster objects
+                    # are large and the CLI drops the rest before printing
                     "--query",
-                    f"[?contains(name, '{self.project_name}')]",
+                    f"[?contains(name, '{self.project_name}')]."
+                    "{name: name, location: location, "
+                    "kubernetesVersion: kubernetesVersion, powerState: powerState, "
+                    "agentPoolProfiles: agentPoolProfiles[].{count: count}}",
                     "--output",
                     "json",
                 ]
             )
-            return json.loads(result.stdout)
         except Exception as e:
             print_warning(f"Could not get AKS clusters: {e}")
             return []
 
+    def get_aks_clusters_for_env(self, environment: str) -> List[Dict[str, Any]]:
+        """Get the project AKS clusters belonging to one environment."""
+        return [
+            cluster
+            for cluster in self.get_aks_clusters()
+            if environment in cluster.get("name", "")
+        ]
+
+    def get_resource_groups_for_env(self, environment: str) -> List[Dict[str, Any]]:
+        """Get the project resource groups belonging to one environment."""
+        return [
+            rg for rg in self.get_resource_groups() if environment in rg.get("name", "")
+        ]
+
+    @cached_lookup
     def get_storage_accounts(self) -> List[Dict[str, Any]]:
         """Get all storage accounts related to the project."""
         try:
-            result = self.run_command(
+            inventory = self.get_project_inventory()
+            if inventory is not None:
+                return inventory["storage_accounts"]
+
+            if REQUESTS_AVAILABLE:
+                short_name = self.project_name.replace("-", "")
+                return [
+                    self.flatten_properties(account)
+                    for account in self.arm_list(
+                        "providers/Microsoft.Storage/storageAccounts", "2023-01-01"
+                    )
+                    if short_name in account["name"]
+                ]
+
+            return self.run_json_command(
                 [
                     "az",
                     "storage",
@@ -164,31 +655,91 @@ class InfrastructureOverview:
                     "json",
                 ]
             )
-            return json.loads(result.stdout)
         except Exception as e:
             print_warning(f"Could not get storage accounts: {e}")
             return []
 
+    @cached_lookup
     def get_service_principals(self) -> List[Dict[str, Any]]:
         """Get all service principals related to the project."""
         try:
-            result = self.run_command(
+            return self.run_json_command(
                 [
                     "az",
                     "ad",
                     "sp",
                     "list",
-                    "--query",
-                    f"[?contains(displayName, '{self.project_name}')]",
+                    # Filter in Microsoft Graph rather than after listing the
+                    # whole tenant; project service principals share the prefix
+                    "--filter",
+                    f"startswith(displayName, '{self.project_name}')",
                     "--output",
                     "json",
                 ]
             )
-            return json.loads(result.stdout)
         except Exception as e:
             print_warning(f"Could not get service principals: {e}")
             return []
 
+    @staticmethod
+    def read_backend_config(backend_file: Path) -> Dict[str, str]:
+        """Read the name = "value" settings from a Terraform backend config."""
+        config = {}
+        for line in backend_file.read_text().splitlines():
+            # Drop full-line and trailing comments; backend settings are plain
+            # names and quoted values without "#" in them
+            line = line.split("#", 1)[0]
+            name, separator, value = line.partition("=")
+            if separator:
+                config[name.strip()] = value.strip().strip('"')
+        return config
+
+    def read_remote_state(self, backend_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Download the raw Terraform state blob named in a backend config.
+
+        This avoids terraform init (provider downloads and backend setup) and
+        terraform show re-serializing the whole state just to count resources.
+
+        Args:
+            backend_file: Path to the environment's backend.conf
+
+        Returns:
+            The parsed state, or None if the blob could not be read
+        """
+        try:
+            config = self.read_backend_config(backend_file)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                state_file = os.path.join(temp_dir, "terraform.tfstate")
+                result = self.run_command(
+                    [
+                        "az",
+                        "storage",
+                        "blob",
+                        "download",
+                        "--account-name",
+                        config["storage_account_name"],
+                        "--container-name",
+                        config["container_name"],
+                        "--name",
+                        config["key"],
+                        "--file",
+                        state_file,
+                        "--auth-mode",
+                        "key",
+                        "--only-show-errors",
+                        "--output",
+                        "none",
+                    ],
+                    check=False,
+                )
+                if result.returncode != 0:
+                    return None
+                with open(state_file, "rb") as f:
+                    return json_loads(f.read())
+        except (KeyError, OSError, ValueError):
+            return None
+
     def get_terraform_state_info(self, environment: str) -> Dict[str, Any]:
         """Get Terraform state information for an environment."""
         terraform_dir = Path(f"terraform")
@@ -208,81 +759,131 @@ class InfrastructureOverview:
         # Try to get Terraform state info
         if info["backend_config_exists"]:
             try:
-                original_dir = Path.cwd()
-                terraform_dir.mkdir(exist_ok=True)
-                subprocess.run(
-                    [
-                        "terraform",
-                        "init",
-                        f"-backend-config=environments/{environment}/backend.conf",
-                    ],
-                    cwd=terraform_dir,
-                    capture_output=True,
-                    check=False,
-                )
-
-                result = subprocess.run(
-                    ["terraform", "show", "-json"],
-                    cwd=terraform_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    state_data = json.loads(result.stdout)
+                state_data = self.read_remote_state(env_dir / "backend.conf")
+                if state_data is not None:
+                    # Raw state lists each resource block with its instances;
+                    # root module blocks carry no "module" key
                     info["state_info"] = {
                         "terraform_version": state_data.get("terraform_version"),
-                        "resource_count": len(
-                            state_data.get("values", {})
-                            .get("root_module", {})
-                            .get("resources", [])
+                        "resource_count": sum(
+                            len(resource.get("instances", []))
+                            for resource in state_data.get("resources", [])
+                            if "module" not in resource
                         ),
                         "last_modified": "Available in state",
                     }
+                else:
+                    # Environments share the terraform working directory, so
+                    # only one may have it initialized at a time
+                    with self._terraform_lock:
+                        terraform_dir.mkdir(exist_ok=True)
+                        subprocess.run(
+                            [
+                                "terraform",
+                                "init",
+                                f"-backend-config=environments/{environment}/backend.conf",
+                            ],
+                            cwd=terraform_dir,
+                            capture_output=True,
+                            check=False,
+                        )
+
+                        result = subprocess.run(
+                            ["terraform", "show", "-json"],
+                            cwd=terraform_dir,
+                            capture_output=True,
+                            text=True,
+                        )
+                    if result.returncode == 0:
+                        state_data = json_loads(result.stdout)
+                        info["state_info"] = {
+                            "terraform_version": state_data.get("terraform_version"),
+                            "resource_count": len(
+                                state_data.get("values", {})
+                                .get("root_module", {})
+                                .get("resources", [])
+                            ),
+                            "last_modified": "Available in state",
+                        }
             except Exception as e:
                 info["state_info"] = {"error": str(e)}
 
         return info
 
-    def get_environment_costs(self, environment: str, days: int = 30) -> Dict[str, Any]:
-        """Get cost information for an environment."""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+    @cached_lookup
+    def get_project_usage(self) -> List[Dict[str, Any]]:
+        """
+        Get consumption usage for every project resource over the cost period.
 
-        try:
-            result = self.run_command(
-                [
-                    "az",
-                    "consumption",
-                    "usage",
-                    "list",
-                    "--start-date",
-                    start_date.strftime("%Y-%m-%d"),
-                    "--end-date",
-                    end_date.strftime("%Y-%m-%d"),
-                    "--query",
-                    f"[?contains(instanceName, '{self.project_name}-{environment}')]",
-                    "--output",
-                    "json",
-                ],
-                check=False,
-            )
+        The consumption API is slow, so one listing for the whole project is
+        shared by all environments and split up client-side.
+        """
+        # Only cost reports need date handling
+        from datetime import datetime, timedelta
 
-            if result.returncode == 0:
-                usage_data = json.loads(result.stdout)
-                total_cost = sum(
-                    float(item.get("pretaxCost", 0)) for item in usage_data
-                )
-                return {
-                    "total_cost": total_cost,
-                    "currency": "USD",
-                    "period_days": days,
-                    "resource_count": len(usage_data),
-                }
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=COST_PERIOD_DAYS)
+        if REQUESTS_AVAILABLE:
+            # Same usage API az consumption uses, without starting the CLI
+            usage = self.arm_list(
+                "providers/Microsoft.Consumption/usageDetails",
+                "2018-01-31",
+                f"properties/usageStart ge '{start_date:%Y-%m-%d}' and "
+                f"properties/usageEnd le '{end_date:%Y-%m-%d}'",
+            )
+            return [
+                self.flatten_properties(item)
+                for item in usage
+                if f"{self.project_name}-"
+                in (item.get("properties") or {}).get("instanceName", "")
+            ]
+
+        result = self.run_command(
+            [
+                "az",
+                "consumption",
+                "usage",
+                "list",
+                "--start-date",
+                start_date.strftime("%Y-%m-%d"),
+                "--end-date",
+                end_date.strftime("%Y-%m-%d"),
+                "--query",
+                f"[?contains(instanceName, '{self.project_name}-')]",
+                "--output",
+                "json",
+            ],
+            check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError("Cost data unavailable")
+        return json_loads(result.stdout)
+
+    def get_environment_costs(self, environment: str) -> Dict[str, Any]:
+        """Get cost information for an environment."""
+        try:
+            prefix = f"{self.project_name}-{environment}"
+            usage_data = [
+                item
+                for item in self.get_project_usage()
+                if prefix in item.get("instanceName", "")
+            ]
+        except RuntimeError as e:
+            return {"error": str(e)}
         except Exception as e:
             return {"error": f"Cost data unavailable: {e}"}
 
-        return {"error": "Cost data unavailable"}
+        total_cost = math.fsum(
+            float(item["pretaxCost"]) for item in usage_data if "pretaxCost" in item
+        )
+        return {
+            "total_cost": total_cost,
+            "currency": "USD",
+            "period_days": COST_PERIOD_DAYS,
+            "resource_count": len(usage_data),
+        }
 
+    @cached_lookup
     def get_github_secrets(self) -> Dict[str, Any]:
         """Get GitHub repository secrets information."""
         try:
@@ -290,7 +891,7 @@ class InfrastructureOverview:
                 ["gh", "secret", "list", "--json", "name,visibility"], check=False
             )
             if result.returncode == 0:
-                secrets = json.loads(result.stdout)
+                secrets = json_loads(result.stdout)
                 return {
                     "repository_secrets": [s["name"] for s in secrets],
                     "secret_count": len(secrets),
@@ -300,6 +901,7 @@ class InfrastructureOverview:
 
         return {"error": "GitHub CLI not available or not authenticated"}
 
+    @cached_lookup
     def get_github_environment_secrets(self, environment: str) -> Dict[str, Any]:
         """Get GitHub environment-specific secrets and variables."""
         try:
@@ -318,7 +920,7 @@ class InfrastructureOverview:
             env_info = {"environment": environment}
 
             if secrets_result.returncode == 0:
-                secrets = json.loads(secrets_result.stdout)
+                secrets = json_loads(secrets_result.stdout)
                 env_info["secrets"] = [s["name"] for s in secrets]
                 env_info["secret_count"] = len(secrets)
             else:
@@ -327,7 +929,7 @@ class InfrastructureOverview:
                 env_info["secrets_error"] = "Could not retrieve secrets"
 
             if vars_result.returncode == 0:
-                variables = json.loads(vars_result.stdout)
+                variables = json_loads(vars_result.stdout)
                 env_info["variables"] = [v["name"] for v in variables]
                 env_info["variable_count"] = len(variables)
             else:
@@ -343,217 +945,423 @@ class InfrastructureOverview:
                 "error": f"Could not get GitHub environment info: {e}",
             }
 
-    def check_github_environment_exists(self, environment: str) -> bool:
-        """Check if a GitHub environment exists."""
+    @cached_lookup
+    def get_github_environments(self) -> List[str]:
+        """Get the names of all GitHub environments in the repository."""
         try:
             result = self.run_command(
-                ["gh", "api", f"/repos/{{owner}}/{{repo}}/environments/{environment}"],
+                [
+                    "gh",
+                    "api",
+                    "--paginate",
+                    "/repos/{owner}/{repo}/environments",
+                    "--jq",
+                    ".environments[].name",
+                ],
                 check=False,
             )
-            return result.returncode == 0
+            if result.returncode == 0:
+                return result.stdout.splitlines()
         except Exception:
-            return False
+            pass
+        return []
+
+    def check_github_environment_exists(self, environment: str) -> bool:
+        """Check if a GitHub environment exists."""
+        # One listing answers this for every environment in the overview
+        return environment in self.get_github_environments()
+
+    def emit(self, line: str = ""):
+        """Queue a line of report output; flush_output writes it."""
+        self._out.append(line)
+
+    def flush_output(self):
+        """
+        Write the queued report lines in one call.
+
+        Sections are written whole rather than line by line, which saves a
+        write per line when output is piped and keeps warnings from the
+        lookup threads from landing in the middle of a section.
+        """
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            sys.stdout.flush()
+            self._out.clear()
+
+    def collect_report(
+        self, environments: List[str], include_costs: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Gather the overview as data, with the same sections as the text report.
+
+        Args:
+            environments: Environments to include
+            include_costs: Include cost information for each environment
+
+        Returns:
+            Report dictionary suitable for JSON output
+        """
+        with ThreadPoolExecutor(
+            max_workers=overview_workers(len(environments))
+        ) as executor:
+            overview_lookups = self.submit_overview_lookups(executor)
+            env_lookups = {
+                env: self.submit_environment_lookups(executor, env, include_costs)
+                for env in environments
+            }
+
+            report = self.overview_report(overview_lookups)
+            for env, lookups in env_lookups.items():
+                report["environments"][env] = self.environment_report(lookups)
+
+        self.save_overview_cache()
+        return report
+
+    def submit_overview_lookups(self, executor: Executor) -> Dict[str, Future]:
+        """Start the lookups for the sections shared by all environments."""
+        return {
+            "subscription": executor.submit(self.get_subscription_info),
+            "resource_groups": executor.submit(self.get_resource_groups),
+            "service_principals": executor.submit(self.get_service_principals),
+            "storage_accounts": executor.submit(self.get_storage_accounts),
+            "github_secrets": executor.submit(self.get_github_secrets),
+        }
+
+    def overview_report(self, lookups: Dict[str, Future]) -> Dict[str, Any]:
+        """
+        Build the report's shared sections from submit_overview_lookups.
+
+        Returns:
+            Report dictionary with an empty "environments" section
+        """
+        return {
+            "project": self.project_name,
+            "subscription": lookups["subscription"].result(),
+            "resource_groups": [
+                {
+                    "name": rg["name"],
+                    "location": rg.get("location", "Unknown"),
+                    "provisioning_state": rg.get("properties", {}).get(
+                        "provisioningState", "Unknown"
+                    ),
+                }
+                for rg in lookups["resource_groups"].result()
+            ],
+            "service_principals": [
+                {
+                    "display_name": sp["displayName"],
+                    "app_id": sp.get("appId", "Unknown"),
+                    "enabled": bool(sp.get("accountEnabled")),
+                }
+                for sp in lookups["service_principals"].result()
+            ],
+            "terraform_state_storage": [
+                {
+                    "name": sa["name"],
+                    "location": sa.get("location", "Unknown"),
+                    "tier": sa.get("sku", {}).get("tier", "Unknown"),
+                }
+                for sa in lookups["storage_accounts"].result()
+            ],
+            "github_repository_secrets": lookups["github_secrets"].result(),
+            "environments": {},
+        }
+
+    def environment_report(
+        self, lookups: Dict[str, Optional[Future]]
+    ) -> Dict[str, Any]:
+        """
+        Build one environment's report section from submit_environment_lookups.
+
+        Returns:
+            Environment dictionary; "costs" is present only if it was looked up
+        """
+        project_resources = lookups["project_resources"].result()
+        resource_groups = {}
+        for rg in lookups["resource_groups"].result():
+            # Group resource names by type
+            resource_types: Dict[str, List[str]] = defaultdict(list)
+            for resource in project_resources.get(rg["name"].lower(), []):
+                resource_types[resource.get("type", "Unknown")].append(
+                    resource.get("name", "Unknown")
+                )
+            resource_groups[rg["name"]] = dict(resource_types)
+
+        env_report = {
+            "terraform": lookups["terraform"].result(),
+            "aks_clusters": [
+                {
+                    "name": cluster["name"],
+                    "status": cluster.get("powerState", {}).get("code", "Unknown"),
+                    "node_count": cluster.get("agentPoolProfiles", [{}])[0].get(
+                        "count", 0
+                    ),
+                    "kubernetes_version": cluster.get("kubernetesVersion", "Unknown"),
+                    "location": cluster.get("location", "Unknown"),
+                }
+                for cluster in lookups["aks_clusters"].result()
+            ],
+            "resource_groups": resource_groups,
+            "github_environment": {
+                "exists": lookups["github_exists"].result(),
+                **lookups["github"].result(),
+            },
+        }
+        if lookups["costs"] is not None:
+            env_report["costs"] = lookups["costs"].result()
+        return env_report
 
     def display_overview(self, environments: List[str], include_costs: bool = False):
         """Display comprehensive infrastructure overview."""
-        print("=" * 80)
-        print(f"INFRASTRUCTURE OVERVIEW - {self.project_name.upper()}")
-        print("=" * 80)
-        print()
+        self.emit("=" * 80)
+        self.emit(f"INFRASTRUCTURE OVERVIEW - {self.project_name.upper()}")
+        self.emit("=" * 80)
+        self.emit()
+
+        # The lookups are independent, so run them concurrently and print
+        # their results in order as they are needed
+        with ThreadPoolExecutor(
+            max_workers=overview_workers(len(environments))
+        ) as executor:
+            self._display_overview(executor, environments, include_costs)
+        self.save_overview_cache()
+
+    def _display_overview(
+        self, executor: Executor, environments: List[str], include_costs: bool
+    ):
+        """Print the overview, fetching its sections through the executor."""
+        overview_lookups = self.submit_overview_lookups(executor)
+        # Start every environment's lookups now as well, so all environments
+        # are fetched in parallel while the sections print in order
+        env_lookups = {
+            env: self.submit_environment_lookups(executor, env, include_costs)
+            for env in environments
+        }
 
+        self.render_overview(self.overview_report(overview_lookups))
+        self.flush_output()
+
+        # Environment-specific details
+        for env in environments:
+            self.display_environment_details(
+                env, include_costs, executor, env_lookups[env]
+            )
+
+    def render_overview(self, report: Dict[str, Any]):
+        """Print the shared sections of a report built by overview_report."""
         # Subscription info
-        sub_info = self.get_subscription_info()
+        sub_info = report["subscription"]
         if sub_info:
-            print("AZURE SUBSCRIPTION")
-            print("-" * 40)
-            print(f"Name: {sub_info.get('subscription_name', 'Unknown')}")
-            print(f"ID: {sub_info.get('subscription_id', 'Unknown')}")
-            print(f"Tenant: {sub_info.get('tenant_id', 'Unknown')}")
-            print()
+            self.emit("AZURE SUBSCRIPTION")
+            self.emit("-" * 40)
+            self.emit(f"Name: {sub_info.get('subscription_name', 'Unknown')}")
+            self.emit(f"ID: {sub_info.get('subscription_id', 'Unknown')}")
+            self.emit(f"Tenant: {sub_info.get('tenant_id', 'Unknown')}")
+            self.emit()
 
         # Resource Groups
-        resource_groups = self.get_resource_groups()
-        if resource_groups:
-            print("RESOURCE GROUPS")
-            print("-" * 40)
-            for rg in resource_groups:
-                location = rg.get("location", "Unknown")
-                status = rg.get("properties", {}).get("provisioningState", "Unknown")
-                print(f"• {rg['name']} ({location}) - {status}")
-            print()
+        if report["resource_groups"]:
+            self.emit("RESOURCE GROUPS")
+            self.emit("-" * 40)
+            for rg in report["resource_groups"]:
+                self.emit(
+                    f"• {rg['name']} ({rg['location']}) - {rg['provisioning_state']}"
+                )
+            self.emit()
 
         # Service Principals
-        service_principals = self.get_service_principals()
-        if service_principals:
-            print("SERVICE PRINCIPALS")
-            print("-" * 40)
-            for sp in service_principals:
-                app_id = sp.get("appId", "Unknown")
-                enabled = "ENABLED" if sp.get("accountEnabled") else "DISABLED"
-                print(f"• {sp['displayName']} ({app_id}) - {enabled}")
-            print()
+        if report["service_principals"]:
+            self.emit("SERVICE PRINCIPALS")
+            self.emit("-" * 40)
+            for sp in report["service_principals"]:
+                enabled = "ENABLED" if sp["enabled"] else "DISABLED"
+                self.emit(f"• {sp['display_name']} ({sp['app_id']}) - {enabled}")
+            self.emit()
 
         # Storage Accounts (Terraform State)
-        storage_accounts = self.get_storage_accounts()
-        if storage_accounts:
-            print("TERRAFORM STATE STORAGE")
-            print("-" * 40)
-            for sa in storage_accounts:
-                location = sa.get("location", "Unknown")
-                tier = sa.get("sku", {}).get("tier", "Unknown")
-                print(f"• {sa['name']} ({location}) - {tier}")
-            print()
+        if report["terraform_state_storage"]:
+            self.emit("TERRAFORM STATE STORAGE")
+            self.emit("-" * 40)
+            for sa in report["terraform_state_storage"]:
+                self.emit(f"• {sa['name']} ({sa['location']}) - {sa['tier']}")
+            self.emit()
 
         # GitHub Repository Secrets
-        github_secrets = self.get_github_secrets()
-        print("GITHUB REPOSITORY SECRETS")
-        print("-" * 40)
+        github_secrets = report["github_repository_secrets"]
+        self.emit("GITHUB REPOSITORY SECRETS")
+        self.emit("-" * 40)
         if "error" in github_secrets:
-            print(f"ERROR: {github_secrets['error']}")
+            self.emit(f"ERROR: {github_secrets['error']}")
         else:
-            print(f"Repository secrets: {github_secrets['secret_count']}")
+            self.emit(f"Repository secrets: {github_secrets['secret_count']}")
             if github_secrets["repository_secrets"]:
                 for secret in github_secrets["repository_secrets"]:
-                    print(f"• {secret}")
+                    self.emit(f"• {secret}")
             else:
-                print("• No repository secrets found")
-        print()
-
-        # Environment-specific details
-        for env in environments:
-            self.display_environment_details(env, include_costs)
+                self.emit("• No repository secrets found")
+        self.emit()
+
+    def submit_environment_lookups(
+        self, executor: Executor, environment: str, include_costs: bool = False
+    ) -> Dict[str, Optional[Future]]:
+        """
+        Start every independent lookup for an environment.
+
+        Args:
+            executor: Executor to run the lookups on
+            environment: Environment name
+            include_costs: Also look up the environment's costs
+
+        Returns:
+            Dictionary of futures by lookup; "costs" is None without costs
+        """
+        return {
+            "terraform": executor.submit(self.get_terraform_state_info, environment),
+            "aks_clusters": executor.submit(self.get_aks_clusters_for_env, environment),
+            "resource_groups": executor.submit(
+                self.get_resource_groups_for_env, environment
+            ),
+            "project_resources": executor.submit(self.get_project_resources),
+            "github_exists": executor.submit(
+                self.check_github_environment_exists, environment
+            ),
+            "github": executor.submit(self.get_github_environment_secrets, environment),
+            "costs": (
+                executor.submit(self.get_environment_costs, environment)
+                if include_costs
+                else None
+            ),
+        }
 
     def display_environment_details(
-        self, environment: str, include_costs: bool = False
+        self,
+        environment: str,
+        include_costs: bool = False,
+        executor: Optional[Executor] = None,
+        lookups: Optional[Dict[str, Optional[Future]]] = None,
     ):
         """Display detailed information for a specific environment."""
-        print(f"ENVIRONMENT: {environment.upper()}")
-        print("=" * 60)
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=overview_workers(1)) as executor:
+                return self.display_environment_details(
+                    environment, include_costs, executor
+                )
+
+        if lookups is None:
+            lookups = self.submit_environment_lookups(
+                executor, environment, include_costs
+            )
+        self.render_environment(environment, self.environment_report(lookups))
+        self.flush_output()
+
+    def render_environment(self, environment: str, env_report: Dict[str, Any]):
+        """Print one environment's section built by environment_report."""
+        self.emit(f"ENVIRONMENT: {environment.upper()}")
+        self.emit("=" * 60)
 
         # Terraform state info
-        tf_info = self.get_terraform_state_info(environment)
-        print("Terraform State")
-        print("-" * 30)
+        tf_info = env_report["terraform"]
+        self.emit("Terraform State")
+        self.emit("-" * 30)
         if "error" in tf_info:
-            print(f"ERROR: {tf_info['error']}")
+            self.emit(f"ERROR: {tf_info['error']}")
         else:
-            print(
+            self.emit(
                 f"Backend Config: {'YES' if tf_info['backend_config_exists'] else 'NO'}"
             )
-            print(f"Variables File: {'YES' if tf_info['tfvars_exists'] else 'NO'}")
+            self.emit(f"Variables File: {'YES' if tf_info['tfvars_exists'] else 'NO'}")
             if tf_info["state_info"]:
                 if "error" in tf_info["state_info"]:
-                    print(f"State: ERROR - {tf_info['state_info']['error']}")
+                    self.emit(f"State: ERROR - {tf_info['state_info']['error']}")
                 else:
-                    print(
+                    self.emit(
                         f"Resources: {tf_info['state_info'].get('resource_count', 0)}"
                     )
-                    print(
+                    self.emit(
                         f"TF Version: {tf_info['state_info'].get('terraform_version', 'Unknown')}"
                     )
-        print()
+        self.emit()
 
         # AKS Clusters
-        aks_clusters = [
-            cluster
-            for cluster in self.get_aks_clusters()
-            if environment in cluster.get("name", "")
-        ]
-        if aks_clusters:
-            print("AKS Clusters")
-            print("-" * 30)
-            for cluster in aks_clusters:
-                status = cluster.get("powerState", {}).get("code", "Unknown")
-                node_count = cluster.get("agentPoolProfiles", [{}])[0].get("count", 0)
-                k8s_version = cluster.get("kubernetesVersion", "Unknown")
-                print(f"• {cluster['name']}")
-                print(f"  Status: {status}")
-                print(f"  Nodes: {node_count}")
-                print(f"  K8s Version: {k8s_version}")
-                print(f"  Location: {cluster.get('location', 'Unknown')}")
+        if env_report["aks_clusters"]:
+            self.emit("AKS Clusters")
+            self.emit("-" * 30)
+            for cluster in env_report["aks_clusters"]:
+                self.emit(f"• {cluster['name']}")
+                self.emit(f"  Status: {cluster['status']}")
+                self.emit(f"  Nodes: {cluster['node_count']}")
+                self.emit(f"  K8s Version: {cluster['kubernetes_version']}")
+                self.emit(f"  Location: {cluster['location']}")
         else:
-            print("AKS Clusters: None found")
-        print()
+            self.emit("AKS Clusters: None found")
+        self.emit()
 
         # Environment-specific resource groups
-        env_resource_groups = [
-            rg for rg in self.get_resource_groups() if environment in rg.get("name", "")
-        ]
-
-        for rg in env_resource_groups:
-            resources = self.get_resources_in_group(rg["name"])
-            if resources:
-                print(f"Resources in {rg['name']}")
-                print("-" * 50)
-
-                # Group resources by type
-                resource_types = {}
-                for resource in resources:
-                    res_type = resource.get("type", "Unknown")
-                    if res_type not in resource_types:
-                        resource_types[res_type] = []
-                    resource_types[res_type].append(resource)
-
-                for res_type, res_list in resource_types.items():
-                    print(f"  {res_type}: {len(res_list)} resources")
-                    for resource in res_list[:3]:  # Show first 3 resources
-                        print(f"    • {resource.get('name', 'Unknown')}")
-                    if len(res_list) > 3:
-                        print(f"    ... and {len(res_list) - 3} more")
-                print()
+        for rg_name, resource_types in env_report["resource_groups"].items():
+            if resource_types:
+                self.emit(f"Resources in {rg_name}")
+                self.emit("-" * 50)
+                for res_type, names in resource_types.items():
+                    self.emit(f"  {res_type}: {len(names)} resources")
+                    for name in names[:3]:  # Show first 3 resources
+                        self.emit(f"    • {name}")
+                    if len(names) > 3:
+                        self.emit(f"    ... and {len(names) - 3} more")
+                self.emit()
 
         # GitHub Environment Configuration
-        print("GitHub Environment")
-        print("-" * 30)
+        self.emit("GitHub Environment")
+        self.emit("-" * 30)
 
-        env_exists = self.check_github_environment_exists(environment)
-        if env_exists:
-            print(f"Environment exists: YES")
+        github_env_info = env_report["github_environment"]
+        if github_env_info["exists"]:
+            self.emit(f"Environment exists: YES")
 
-            github_env_info = self.get_github_environment_secrets(environment)
             if "error" in github_env_info:
-                print(f"ERROR: {github_env_info['error']}")
+                self.emit(f"ERROR: {github_env_info['error']}")
             else:
-                print(f"Secrets: {github_env_info['secret_count']}")
+                self.emit(f"Secrets: {github_env_info['secret_count']}")
                 if github_env_info["secrets"]:
                     for secret in github_env_info["secrets"]:
-                        print(f"  • {secret}")
+                        self.emit(f"  • {secret}")
 
-                print(f"Variables: {github_env_info['variable_count']}")
+                self.emit(f"Variables: {github_env_info['variable_count']}")
                 if github_env_info["variables"]:
                     for variable in github_env_info["variables"]:
-                        print(f"  • {variable}")
+                        self.emit(f"  • {variable}")
 
                 if (
                     github_env_info["secret_count"] == 0
                     and github_env_info["variable_count"] == 0
                 ):
-                    print("WARNING: No secrets or variables configured")
+                    self.emit("WARNING: No secrets or variables configured")
         else:
-            print(f"Environment exists: NO")
-            print("WARNING: GitHub environment not created")
-            print("Run: ./scripts/setup-github-secrets.sh")
-        print()
+            self.emit(f"Environment exists: NO")
+            self.emit("WARNING: GitHub environment not created")
+            self.emit("Run: ./scripts/setup-github-secrets.sh")
+        self.emit()
 
         # Cost information
-        if include_costs:
-            cost_info = self.get_environment_costs(environment)
-            print("Cost Information (Last 30 days)")
-            print("-" * 40)
+        if "costs" in env_report:
+            cost_info = env_report["costs"]
+            self.emit(f"Cost Information (Last {COST_PERIOD_DAYS} days)")
+            self.emit("-" * 40)
             if "error" in cost_info:
-                print(f"ERROR: {cost_info['error']}")
+                self.emit(f"ERROR: {cost_info['error']}")
             else:
-                print(
+                self.emit(
                     f"Total Cost: ${cost_info['total_cost']:.2f} {cost_info['currency']}"
                 )
-                print(f"Resources: {cost_info['resource_count']}")
-            print()
+                self.emit(f"Resources: {cost_info['resource_count']}")
+            self.emit()
 
-        print()
+        self.emit()
 
 
 def main():
     """Main function."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Show infrastructure overview for Azure AKS Platform"
     )
@@ -575,6 +1383,16 @@ def main():
         action="store_true",
         help="Include cost information (requires Azure consumption API access)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output (default: compact)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore lookups cached by runs in the last few minutes",
+    )
     parser.add_argument(
         "--output-format",
         choices=["text", "json"],
@@ -584,6 +1402,12 @@ def main():
 
     args = parser.parse_args()
 
+    stdout = sys.stdout
+    if args.output_format == "json":
+        # Progress messages and warnings go to stderr so that stdout carries
+        # only the report
+        sys.stdout = sys.stderr
+
     # Determine environments to show
     if args.environment:
         environments = [args.environment]
@@ -603,13 +1427,13 @@ def main():
         print()
 
     try:
-        overview = InfrastructureOverview(args.project_name)
+        overview = InfrastructureOverview(args.project_name, refresh=args.refresh)
 
         if args.output_format == "json":
-            # TODO: Implement JSON output format
-            print_warning("JSON output format not yet implemented, using text format")
-
-        overview.display_overview(environments, args.include_costs)
+            report = overview.collect_report(environments, args.include_costs)
+            write_json_report(report, stdout, pretty=args.pretty)
+        else:
+            overview.display_overview(environments, args.include_costs)
 
         print_success("Infrastructure overview completed!")
 
@@ -22,6 +22,7 @@ PROJECT_NAME="aks-platform"
 ENVIRONMENT=""
 ALL_ENVIRONMENTS=false
 INCLUDE_COSTS=false
+REFRESH=false
 OUTPUT_FORMAT="text"
 
 # Colors for output
@@ -62,6 +63,7 @@ OPTIONS:
     -e, --env ENVIRONMENT   Show specific environment only (dev, staging, prod)
     -a, --all               Show all environments
     -c, --costs             Include cost information
+    -r, --refresh           Ignore lookups cached by recent runs
     -f, --format FORMAT     Output format: text, json (default: text)
     
 EXAMPLES:
@@ -109,6 +111,10 @@ parse_arguments() {
                 INCLUDE_COSTS=true
                 shift
                 ;;
+            -r|--refresh)
+                REFRESH=true
+                shift
+                ;;
             -f|--format|--output-format)
                 OUTPUT_FORMAT="$2"
                 shift 2
@@ -181,6 +187,10 @@ build_python_args() {
     if [[ "$INCLUDE_COSTS" == true ]]; then
         args+=("--include-costs")
     fi
+
+    if [[ "$REFRESH" == true ]]; then
+        args+=("--refresh")
+    fi
     
     args+=("--output-format" "$OUTPUT_FORMAT")
     